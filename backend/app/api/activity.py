@@ -1,19 +1,28 @@
 """Activity event endpoints."""
 
 import asyncio
+import os
 import uuid
+import zlib
+from collections import OrderedDict
 from datetime import datetime
-from typing import List, Optional
-
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import select, func
+from typing import Dict, List, Optional, Set, Tuple
+
+import ormsgpack
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.exceptions import RequestValidationError
+from pydantic import ValidationError
+from sqlalchemy import bindparam, select, insert, func, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
+from app.config import settings
 from app.services.user_manager import get_user_manager
 from app.services.mongodb_sync import get_mongodb_sync, MongoDBSyncService
 
 from app.core.database import get_db
+from app.core.commit_coalescer import WriteJob, commit_coalescer
+from app.core.responses import ORJSONResponse
 from app.core.component_registry import ComponentRegistry
 from app.models.activity import ActivityEvent, Classification
 from app.schemas.activity import (
@@ -26,16 +35,266 @@ from app.schemas.activity import (
     IdleActivityResponse,
 )
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# Event IDs committed by recent batches. Extension retries of the same events
+# are acknowledged from here without touching the database.
+_RECENT_EVENT_IDS_MAX = 10_000
+_recent_event_ids: "OrderedDict[str, None]" = OrderedDict()
+
+
+# Bounds concurrent classification threads across requests
+_classify_semaphore = asyncio.Semaphore(os.cpu_count() or 4)
+
+
+# Statements are built once at import; per-request values go in as bound
+# parameters so every call hits the same compiled-cache entry.
+
+# Column projection for ActivityEventResponse: only the response fields with a
+# LEFT OUTER JOIN on the classification, skipping ORM hydration.
+_EVENT_RESPONSE_SELECT = select(
+    ActivityEvent.event_id,
+    ActivityEvent.domain,
+    ActivityEvent.title,
+    ActivityEvent.active_time,
+    ActivityEvent.timestamp,
+    Classification.category,
+    Classification.confidence,
+    Classification.source,
+).join(Classification, ActivityEvent.classification_id == Classification.id, isouter=True)
+
+_STMT_EVENT_BY_ID = _EVENT_RESPONSE_SELECT.where(ActivityEvent.event_id == bindparam("event_id"))
+
+_STMT_EXISTING_EVENT_IDS = select(ActivityEvent.event_id).where(
+    ActivityEvent.event_id.in_(bindparam("event_ids", expanding=True))
+)
+
+_STMT_INSERT_CLASSIFICATIONS = insert(Classification).returning(
+    Classification.id, sort_by_parameter_order=True
+)
+
+# ON CONFLICT DO NOTHING keeps the insert idempotent if another writer
+# stored the same event_id after the dedup lookup; RETURNING yields only the
+# rows actually inserted. The per-session activity_count is bumped by a
+# trigger for each of those rows (see core/database.py).
+_STMT_INSERT_EVENTS = (
+    sqlite_insert(ActivityEvent)
+    .on_conflict_do_nothing(index_elements=["event_id"])
+    .returning(ActivityEvent.event_id)
+)
+
+# Core (not ORM) UPDATE so a parameter list runs as a plain executemany
+_events_table = ActivityEvent.__table__
+_STMT_SET_EVENT_CLASSIFICATION = (
+    update(_events_table)
+    .where(_events_table.c.event_id == bindparam("b_event_id"))
+    .values(classification_id=bindparam("b_classification_id"))
+)
+
+# Event fields build_document does not store (contexts go in as context_data)
+_MONGO_EXCLUDED_FIELDS = frozenset({
+    "user_id", "tab_id", "window_id", "is_incognito",
+    "youtube_context", "google_context", "social_context",
+})
+
+# SQLite has no GROUPING SETS, so totals are summed from the per-category
+# rows (category NULL = unclassified)
+_STATS_SELECT = select(
+    Classification.category,
+    func.count(ActivityEvent.id).label("count"),
+    func.sum(ActivityEvent.active_time).label("time"),
+    func.sum(ActivityEvent.idle_time).label("idle_time"),
+).join(
+    Classification, ActivityEvent.classification_id == Classification.id, isouter=True
+).group_by(Classification.category)
+
+
+def _classify_events(classifier, items: List[dict]) -> tuple:
+    """
+    Classify a batch of events (blocking; run in a worker thread).
 
-# Serialize SQLite writes — aiosqlite only supports one writer at a time.
-# Without this, concurrent batch + idle requests can produce "database is locked".
-_db_write_lock = asyncio.Lock()
+    Returns (results, errors) where errors is a list of (index, message).
+    If the batch call fails, falls back to one call per event so a single
+    bad event does not lose the rest of the batch.
+    """
+    try:
+        # Items come from validated ActivityEventCreate fields; don't re-validate
+        return classifier.process_validated_batch(items), []
+    except Exception:
+        results: List[Optional[dict]] = [None] * len(items)
+        errors: List[tuple] = []
+        for i, item in enumerate(items):
+            try:
+                results[i] = classifier.process(item)
+            except Exception as e:
+                errors.append((i, str(e)))
+        return results, errors
+
+
+def _remember_event_ids(event_ids) -> None:
+    """Record committed event IDs, evicting the oldest beyond the cap."""
+    for event_id in event_ids:
+        _recent_event_ids[event_id] = None
+        _recent_event_ids.move_to_end(event_id)
+    while len(_recent_event_ids) > _RECENT_EVENT_IDS_MAX:
+        _recent_event_ids.popitem(last=False)
+
+
+def _make_write_job(
+    event_values: List[dict],
+    classifications: Dict[str, dict],
+) -> WriteJob:
+    """
+    Build the commit-coalescer job that stores a batch of events.
+
+    Events are inserted first, and classification rows are created only
+    for the events that insert actually stored: an event_id another
+    request stored concurrently, or a row that fails to insert, leaves no
+    orphan classification behind. Re-running the job after its rows were
+    committed stores nothing twice, which the coalescer relies on when it
+    retries jobs one by one.
+
+    The job returns (stored_ids, failed), where failed lists
+    (event_id, error) for rows that could not be stored.
+    """
+    async def write_batch(session: AsyncSession) -> Tuple[Set[str], List[tuple]]:
+        stored_ids: Set[str] = set()
+        failed: List[tuple] = []
+        try:
+            async with session.begin_nested():
+                result = await session.execute(_STMT_INSERT_EVENTS, event_values)
+                stored_ids.update(result.scalars())
+        except Exception:
+            # Rare: a bad row failed the bulk insert — retry row by row to isolate it
+            stored_ids.clear()
+            for values in event_values:
+                try:
+                    async with session.begin_nested():
+                        result = await session.execute(_STMT_INSERT_EVENTS, values)
+                        stored_ids.update(result.scalars())
+                except Exception as e:
+                    failed.append((values["event_id"], str(e)))
+
+        classified = [
+            (event_id, r) for event_id, r in classifications.items() if event_id in stored_ids
+        ]
+        if classified:
+            created_at = datetime.utcnow()
+            result = await session.execute(
+                _STMT_INSERT_CLASSIFICATIONS,
+                [
+                    {
+                        "category": r["category"],
+                        "confidence": r["confidence"],
+                        "source": r["source"],
+                        "created_at": created_at,
+                    }
+                    for _, r in classified
+                ],
+            )
+            await session.execute(
+                _STMT_SET_EVENT_CLASSIFICATION,
+                [
+                    {"b_event_id": event_id, "b_classification_id": classification_id}
+                    for (event_id, _), classification_id in zip(classified, result.scalars())
+                ],
+            )
+        return stored_ids, failed
+
+    return write_batch
+
+
+def _inline_schema_refs(schema: dict) -> dict:
+    """Resolve a model JSON schema's local $defs refs in place of each $ref.
+
+    openapi_extra is copied into the spec verbatim, so "#/$defs/..." refs
+    would dangle there; the activity schemas are not recursive.
+    """
+    defs = schema.pop("$defs", {})
+
+    def resolve(node):
+        if isinstance(node, dict):
+            ref = node.get("$ref")
+            if ref is not None and ref.startswith("#/$defs/"):
+                return resolve(defs[ref[len("#/$defs/"):]])
+            return {key: resolve(value) for key, value in node.items()}
+        if isinstance(node, list):
+            return [resolve(item) for item in node]
+        return node
+
+    return resolve(schema)
+
+
+_BATCH_BODY_SCHEMA = _inline_schema_refs(ActivityBatchRequest.model_json_schema())
+
+# parse_activity_batch reads the raw body, so FastAPI cannot infer it
+_BATCH_OPENAPI_EXTRA = {
+    "requestBody": {
+        "required": True,
+        "description": (
+            "An activity batch as JSON or msgpack. The body may be "
+            "gzip-compressed with Content-Encoding: gzip."
+        ),
+        "content": {
+            content_type: {"schema": _BATCH_BODY_SCHEMA}
+            for content_type in ("application/json", "application/msgpack", "application/x-msgpack")
+        },
+    }
+}
 
 
-@router.post("/batch", response_model=ActivityBatchResponse)
+async def parse_activity_batch(request: Request) -> ActivityBatchRequest:
+    """
+    Decode an activity batch body.
+
+    Accepts JSON or msgpack (Content-Type: application/msgpack), optionally
+    gzip-compressed (Content-Encoding: gzip). Bodies larger than
+    settings.max_request_body_bytes, before or after decompression, are
+    rejected with 413.
+    """
+    limit = settings.max_request_body_bytes
+    body = bytearray()
+    async for chunk in request.stream():
+        body += chunk
+        if len(body) > limit:
+            raise HTTPException(status_code=413, detail="Request body too large")
+
+    encoding = request.headers.get("content-encoding", "").lower()
+    if encoding == "gzip":
+        try:
+            decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+            body = decompressor.decompress(body, limit + 1)
+        except zlib.error:
+            raise HTTPException(status_code=400, detail="Invalid gzip body")
+        if len(body) > limit or decompressor.unconsumed_tail:
+            raise HTTPException(status_code=413, detail="Request body too large")
+    elif encoding not in ("", "identity"):
+        raise HTTPException(status_code=415, detail=f"Unsupported Content-Encoding: {encoding}")
+
+    content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+    try:
+        if content_type in ("application/msgpack", "application/x-msgpack"):
+            try:
+                data = ormsgpack.unpackb(bytes(body))
+            except ormsgpack.MsgpackDecodeError:
+                raise HTTPException(status_code=400, detail="Invalid msgpack body")
+            return ActivityBatchRequest.model_validate(data)
+        return ActivityBatchRequest.model_validate_json(body)
+    except ValidationError as e:
+        errors = []
+        for err in e.errors(include_url=False):
+            err = {**err, "loc": ("body", *err["loc"])}
+            if isinstance(err.get("input"), (bytes, bytearray)):
+                # Raw body of invalid JSON; not JSON-encodable, and FastAPI's
+                # own body parsing reports {} here too
+                err["input"] = {}
+            errors.append(err)
+        raise RequestValidationError(errors)
+
+
+@router.post("/batch", response_model=ActivityBatchResponse, openapi_extra=_BATCH_OPENAPI_EXTRA)
 async def receive_activity_batch(
-    batch: ActivityBatchRequest,
+    batch: ActivityBatchRequest = Depends(parse_activity_batch),
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -46,155 +305,174 @@ async def receive_activity_batch(
     """
     received_ids: List[str] = []
     errors: List[str] = []
-    mongo_documents: List[dict] = []  # Collect docs for MongoDB sync
 
-    registry = ComponentRegistry.get_instance()
-    classifier = registry.get("classification")
-
-    # Get user ID from the user manager
+    # Resolve per-request dependencies once, not per event
+    classifier = ComponentRegistry.get_instance().get("classification")
     user_manager = get_user_manager()
     user_id = user_manager.get_user_id() if user_manager else None
 
-    async with _db_write_lock:
-        for event_data in batch.events:
-            try:
-                # Check if event already exists (deduplication)
-                result = await db.execute(
-                    select(ActivityEvent).where(ActivityEvent.event_id == event_data.event_id)
-                )
-                existing = result.scalar_one_or_none()
-
-                if existing:
-                    received_ids.append(event_data.event_id)
-                    continue
-
-                # Create classification
-                classification = None
-                if classifier:
-                    try:
-                        class_result = classifier.process({
-                            "domain": event_data.domain,
-                            "url": event_data.url,
-                            "title": event_data.title,
-                            "active_time": event_data.active_time,
-                            "path": event_data.path,
-                            # Source identification
-                            "source": event_data.source,
-                            "activity_type": event_data.activity_type,
-                            # Desktop-specific fields
-                            "app_name": event_data.app_name,
-                            "app_path": event_data.app_path,
-                            "window_title": event_data.window_title,
-                            # Context (browser only)
-                            "youtube_context": event_data.youtube_context.model_dump() if event_data.youtube_context else None,
-                            "google_context": event_data.google_context.model_dump() if event_data.google_context else None,
-                            "social_context": event_data.social_context.model_dump() if event_data.social_context else None,
-                        })
-
-                        classification = Classification(
-                            category=class_result["category"],
-                            confidence=class_result["confidence"],
-                            source=class_result["source"],
-                            created_at=datetime.utcnow(),
-                        )
-                        db.add(classification)
-                        await db.flush()  # Get the ID
-
-                    except Exception as e:
-                        errors.append(f"Classification error for {event_data.event_id}: {str(e)}")
-
-                # Build context_data JSON
-                context_data = {}
-                if event_data.youtube_context:
-                    context_data["youtube"] = event_data.youtube_context.model_dump()
-                if event_data.google_context:
-                    context_data["google"] = event_data.google_context.model_dump()
-                if event_data.social_context:
-                    context_data["social"] = event_data.social_context.model_dump()
-
-                # Create activity event
-                event = ActivityEvent(
-                    event_id=event_data.event_id,
-                    user_id=user_id,
-                    session_id=event_data.session_id,
-                    # Source identification
-                    source=event_data.source,
-                    activity_type=event_data.activity_type,
-                    # Timestamps
-                    timestamp=event_data.timestamp,
-                    start_time=event_data.start_time,
-                    end_time=event_data.end_time,
-                    # URL/Domain info
-                    url=event_data.url,
-                    domain=event_data.domain,
-                    path=event_data.path,
-                    title=event_data.title,
-                    # Desktop-specific fields
-                    app_name=event_data.app_name,
-                    app_path=event_data.app_path,
-                    window_title=event_data.window_title,
-                    # Time tracking
-                    active_time=event_data.active_time,
-                    idle_time=event_data.idle_time,
-                    # Tab info
-                    tab_id=event_data.tab_id,
-                    window_id=event_data.window_id,
-                    is_incognito=event_data.is_incognito,
-                    # Enrichment data
-                    url_components=event_data.url_components.model_dump() if event_data.url_components else None,
-                    title_hints=event_data.title_hints.model_dump() if event_data.title_hints else None,
-                    engagement=event_data.engagement.model_dump() if event_data.engagement else None,
-                    context_data=context_data if context_data else None,
-                    classification_id=classification.id if classification else None,
-                )
-
-                db.add(event)
-                received_ids.append(event_data.event_id)
-
-                # Build MongoDB document for sync
-                class_dict = None
-                if classification:
-                    class_dict = {
-                        "category": classification.category,
-                        "confidence": classification.confidence,
-                        "source": classification.source,
-                    }
-
-                mongo_doc = MongoDBSyncService.build_document(
-                    event_data={
-                        "event_id": event_data.event_id,
-                        "session_id": event_data.session_id,
-                        "source": event_data.source,
-                        "activity_type": event_data.activity_type,
-                        "timestamp": event_data.timestamp,
-                        "start_time": event_data.start_time,
-                        "end_time": event_data.end_time,
-                        "url": event_data.url,
-                        "domain": event_data.domain,
-                        "path": event_data.path,
-                        "title": event_data.title,
-                        "app_name": event_data.app_name,
-                        "app_path": event_data.app_path,
-                        "window_title": event_data.window_title,
-                        "active_time": event_data.active_time,
-                        "idle_time": event_data.idle_time,
-                        "url_components": event_data.url_components.model_dump() if event_data.url_components else None,
-                        "title_hints": event_data.title_hints.model_dump() if event_data.title_hints else None,
-                        "engagement": event_data.engagement.model_dump() if event_data.engagement else None,
-                        "context_data": context_data if context_data else None,
-                    },
-                    classification=class_dict,
-                    user_id=user_id or "",
-                )
-                mongo_documents.append(mongo_doc)
+    # Pass 0: dedup + classify (before any write), collecting rows to insert
+    pending: List[tuple] = []  # (event_data, context_data[, class_result])
+    pending_ids: set = set()
+
+    # Deduplicate against recently committed IDs, then look up the rest in a single query
+    existing_ids = {e.event_id for e in batch.events if e.event_id in _recent_event_ids}
+    incoming_ids = [e.event_id for e in batch.events if e.event_id not in existing_ids]
+    if incoming_ids:
+        result = await db.execute(_STMT_EXISTING_EVENT_IDS, {"event_ids": incoming_ids})
+        existing_ids.update(result.scalars())
+
+    # Release the pooled connection — writes happen on the commit coalescer's own session
+    await db.close()
+
+    for event_data in batch.events:
+        # Skip events already stored or seen earlier in this batch
+        if event_data.event_id in existing_ids or event_data.event_id in pending_ids:
+            received_ids.append(event_data.event_id)
+            continue
+
+        # Build context_data JSON (shared by classifier, SQLite row and mongo doc)
+        context_data = {}
+        if event_data.youtube_context:
+            context_data["youtube"] = event_data.youtube_context.model_dump(mode="python")
+        if event_data.google_context:
+            context_data["google"] = event_data.google_context.model_dump(mode="python")
+        if event_data.social_context:
+            context_data["social"] = event_data.social_context.model_dump(mode="python")
+
+        pending.append((event_data, context_data))
+        pending_ids.add(event_data.event_id)
+
+    # Classify the whole batch in one call
+    class_results: List[Optional[dict]] = [None] * len(pending)
+    if classifier and pending:
+        classifier_inputs = [
+            {
+                "domain": event_data.domain,
+                "url": event_data.url,
+                "title": event_data.title,
+                "active_time": event_data.active_time,
+                "path": event_data.path,
+                # Source identification
+                "source": event_data.source,
+                "activity_type": event_data.activity_type,
+                # Desktop-specific fields
+                "app_name": event_data.app_name,
+                "app_path": event_data.app_path,
+                "window_title": event_data.window_title,
+                # Context (browser only)
+                "youtube_context": context_data.get("youtube"),
+                "google_context": context_data.get("google"),
+                "social_context": context_data.get("social"),
+            }
+            for event_data, context_data in pending
+        ]
+        # Classification may run ML inference — keep it off the event loop and out of the write path
+        async with _classify_semaphore:
+            class_results, class_errors = await asyncio.to_thread(
+                _classify_events, classifier, classifier_inputs
+            )
+        for i, error in class_errors:
+            errors.append(f"Classification error for {pending[i][0].event_id}: {error}")
 
-            except Exception as e:
-                errors.append(f"Error processing {event_data.event_id}: {str(e)}")
+    pending = [
+        (event_data, context_data, class_result)
+        for (event_data, context_data), class_result in zip(pending, class_results)
+    ]
 
-    # Sync to MongoDB in the background (fire-and-forget)
+    # Pass 1: build event rows, classification rows and mongo event dicts
     mongo_sync = get_mongodb_sync()
-    if mongo_sync and mongo_documents:
-        asyncio.create_task(mongo_sync.sync_batch(mongo_documents))
+    event_values: List[dict] = []
+    classifications: Dict[str, dict] = {}
+    mongo_events: List[dict] = []
+    mongo_classifications: List[Optional[dict]] = []
+    for event_data, context_data, class_result in pending:
+        if class_result:
+            classifications[event_data.event_id] = class_result
+
+        event_values.append({
+            "event_id": event_data.event_id,
+            "user_id": user_id,
+            "session_id": event_data.session_id,
+            # Source identification
+            "source": event_data.source,
+            "activity_type": event_data.activity_type,
+            # Timestamps
+            "timestamp": event_data.timestamp,
+            "start_time": event_data.start_time,
+            "end_time": event_data.end_time,
+            # URL/Domain info
+            "url": event_data.url,
+            "domain": event_data.domain,
+            "path": event_data.path,
+            "title": event_data.title,
+            # Desktop-specific fields
+            "app_name": event_data.app_name,
+            "app_path": event_data.app_path,
+            "window_title": event_data.window_title,
+            # Time tracking
+            "active_time": event_data.active_time,
+            "idle_time": event_data.idle_time,
+            # Tab info
+            "tab_id": event_data.tab_id,
+            "window_id": event_data.window_id,
+            "is_incognito": event_data.is_incognito,
+            # Enrichment data (ModelJSON serializes the sub-models directly)
+            "url_components": event_data.url_components,
+            "title_hints": event_data.title_hints,
+            "engagement": event_data.engagement,
+            "context_data": context_data if context_data else None,
+            "classification_id": None,  # set by the write job once the event is stored
+        })
+
+        if not mongo_sync:
+            continue
+
+        # Build MongoDB document for sync (BSON needs plain dicts)
+        class_dict = None
+        if class_result:
+            class_dict = {
+                "category": class_result["category"],
+                "confidence": class_result["confidence"],
+                "source": class_result["source"],
+            }
+
+        # One model_dump walks the event (and nested models) in pydantic-core
+        mongo_event = event_data.model_dump(mode="python", exclude=_MONGO_EXCLUDED_FIELDS)
+        mongo_event["context_data"] = context_data if context_data else None
+        mongo_events.append(mongo_event)
+        mongo_classifications.append(class_dict)
+
+    # Pass 2: store events and their classifications in the coalescer's
+    # shared transaction
+    stored_ids: Set[str] = set()
+    if event_values:
+        stored_ids, failed = await commit_coalescer.submit(
+            _make_write_job(event_values, classifications)
+        )
+        failed_ids = set()
+        for event_id, error in failed:
+            failed_ids.add(event_id)
+            errors.append(f"Error processing {event_id}: {error}")
+        pending_ids -= failed_ids
+        _remember_event_ids(pending_ids)
+        # Events skipped by ON CONFLICT were stored by another request: still acknowledged
+        received_ids.extend(v["event_id"] for v in event_values if v["event_id"] not in failed_ids)
+
+    # Hand events this request stored to the MongoDB background writer
+    # (fire-and-forget); duplicates are mirrored by the request that stored them
+    if mongo_events and stored_ids:
+        stored = [
+            (event, class_dict)
+            for event, class_dict in zip(mongo_events, mongo_classifications)
+            if event["event_id"] in stored_ids
+        ]
+        if stored:
+            mongo_sync.enqueue(MongoDBSyncService.build_documents(
+                [event for event, _ in stored],
+                [class_dict for _, class_dict in stored],
+                user_id or "",
+            ))
 
     return ActivityBatchResponse(
         success=len(errors) == 0,
@@ -204,6 +482,23 @@ async def receive_activity_batch(
     )
 
 
+def _event_response(row) -> ActivityEventResponse:
+    """Build an ActivityEventResponse from an _EVENT_RESPONSE_SELECT row."""
+    event_id, domain, title, active_time, timestamp, category, confidence, source = row
+    return ActivityEventResponse(
+        event_id=event_id,
+        domain=domain,
+        title=title or "",
+        active_time=active_time,
+        timestamp=timestamp,
+        classification=ClassificationResult(
+            category=category,
+            confidence=confidence,
+            source=source,
+        ) if category is not None else None,
+    )
+
+
 @router.get("/recent", response_model=List[ActivityEventResponse])
 async def get_recent_activity(
     limit: int = Query(50, ge=1, le=500),
@@ -216,7 +511,7 @@ async def get_recent_activity(
 
     Optionally filter by session_id or domain.
     """
-    query = select(ActivityEvent).options(selectinload(ActivityEvent.classification))
+    query = _EVENT_RESPONSE_SELECT
 
     if session_id:
         query = query.where(ActivityEvent.session_id == session_id)
@@ -227,23 +522,7 @@ async def get_recent_activity(
     query = query.order_by(ActivityEvent.timestamp.desc()).limit(limit)
 
     result = await db.execute(query)
-    events = result.scalars().all()
-
-    return [
-        ActivityEventResponse(
-            event_id=e.event_id,
-            domain=e.domain,
-            title=e.title or "",
-            active_time=e.active_time,
-            timestamp=e.timestamp,
-            classification=ClassificationResult(
-                category=e.classification.category,
-                confidence=e.classification.confidence,
-                source=e.classification.source,
-            ) if e.classification else None,
-        )
-        for e in events
-    ]
+    return [_event_response(row) for row in result.all()]
 
 
 @router.get("/stats")
@@ -252,35 +531,26 @@ async def get_activity_stats(
     db: AsyncSession = Depends(get_db)
 ):
     """Get activity statistics."""
-    query = select(
-        func.count(ActivityEvent.id).label("total_events"),
-        func.sum(ActivityEvent.active_time).label("total_active_time"),
-        func.sum(ActivityEvent.idle_time).label("total_idle_time"),
-    )
+    query = _STATS_SELECT
 
     if session_id:
         query = query.where(ActivityEvent.session_id == session_id)
 
     result = await db.execute(query)
-    row = result.one()
-
-    # Get category breakdown
-    category_query = select(
-        Classification.category,
-        func.count(ActivityEvent.id).label("count"),
-        func.sum(ActivityEvent.active_time).label("time"),
-    ).join(ActivityEvent.classification).group_by(Classification.category)
-
-    if session_id:
-        category_query = category_query.where(ActivityEvent.session_id == session_id)
 
-    category_result = await db.execute(category_query)
-    categories = {r.category: {"count": r.count, "time": r.time or 0} for r in category_result}
+    total_events = total_active_time = total_idle_time = 0
+    categories = {}
+    for category, count, time, idle_time in result:
+        total_events += count
+        total_active_time += time or 0
+        total_idle_time += idle_time or 0
+        if category is not None:
+            categories[category] = {"count": count, "time": time or 0}
 
     return {
-        "total_events": row.total_events or 0,
-        "total_active_time": row.total_active_time or 0,
-        "total_idle_time": row.total_idle_time or 0,
+        "total_events": total_events,
+        "total_active_time": total_active_time,
+        "total_idle_time": total_idle_time,
         "by_category": categories,
     }
 
@@ -295,10 +565,7 @@ async def get_current_user_id():
 
 
 @router.post("/idle", response_model=IdleActivityResponse)
-async def submit_idle_activity(
-    data: IdleActivityRequest,
-    db: AsyncSession = Depends(get_db)
-):
+async def submit_idle_activity(data: IdleActivityRequest):
     """
     Record what the user was doing during an idle period.
 
@@ -309,7 +576,7 @@ async def submit_idle_activity(
         registry = ComponentRegistry.get_instance()
         classifier = registry.get("classification")
 
-        # Classify the idle activity (CPU-bound, done outside lock)
+        # Classify the idle activity (CPU-bound, done before the write)
         class_result = None
         if classifier:
             class_result = classifier.classify_idle_activity(
@@ -324,7 +591,8 @@ async def submit_idle_activity(
         event_id = str(uuid.uuid4())
         activity_title = data.custom_label or data.activity_id or "idle"
 
-        async with _db_write_lock:
+        # Written through the commit coalescer (single SQLite writer)
+        async def write_idle(session: AsyncSession) -> None:
             # Create classification record
             classification = None
             if class_result:
@@ -334,8 +602,8 @@ async def submit_idle_activity(
                     source=class_result["source"],
                     created_at=datetime.utcnow(),
                 )
-                db.add(classification)
-                await db.flush()
+                session.add(classification)
+                await session.flush()
 
             # Create the activity event
             event = ActivityEvent(
@@ -358,17 +626,19 @@ async def submit_idle_activity(
                 classification_id=classification.id if classification else None,
             )
 
-            db.add(event)
+            session.add(event)
+
+        await commit_coalescer.submit(write_idle)
 
-        # Sync to MongoDB in the background (outside lock)
+        # Sync to MongoDB in the background
         mongo_sync = get_mongodb_sync()
         if mongo_sync:
             class_dict = None
-            if classification:
+            if class_result:
                 class_dict = {
-                    "category": classification.category,
-                    "confidence": classification.confidence,
-                    "source": classification.source,
+                    "category": class_result["category"],
+                    "confidence": class_result["confidence"],
+                    "source": class_result["source"],
                 }
 
             mongo_doc = MongoDBSyncService.build_document(
@@ -388,7 +658,7 @@ async def submit_idle_activity(
                 classification=class_dict,
                 user_id=user_id or "",
             )
-            asyncio.create_task(mongo_sync.sync_batch([mongo_doc]))
+            mongo_sync.enqueue([mongo_doc])
 
         return IdleActivityResponse(
             success=True,
@@ -408,26 +678,10 @@ async def get_activity_event(
     db: AsyncSession = Depends(get_db)
 ):
     """Get a specific activity event by ID."""
-    result = await db.execute(
-        select(ActivityEvent)
-        .options(selectinload(ActivityEvent.classification))
-        .where(ActivityEvent.event_id == event_id)
-    )
-    event = result.scalar_one_or_none()
+    result = await db.execute(_STMT_EVENT_BY_ID, {"event_id": event_id})
+    row = result.one_or_none()
 
-    if not event:
+    if not row:
         raise HTTPException(status_code=404, detail="Event not found")
 
-    return ActivityEventResponse(
-        event_id=event.event_id,
-        domain=event.domain,
-        title=event.title or "",
-        active_time=event.active_time,
-        timestamp=event.timestamp,
-        classification=ClassificationResult(
-            category=event.classification.category,
-            confidence=event.classification.confidence,
-            source=event.classification.source,
-        ) if event.classification else None,
-    )
-
+    return _event_response(row)
@@ -1,13 +1,27 @@
 """Health check endpoint."""
 
+import time
+
 from fastapi import APIRouter
 from app.config import settings
 from app.core.component_registry import ComponentRegistry
+from app.core.database import get_pool_status
 from app.services.user_manager import get_user_manager
 from app.services.mongodb_sync import get_mongodb_sync
 
 router = APIRouter()
 
+# Electron polls /health frequently; serve a snapshot up to this old
+HEALTH_CACHE_TTL_SECONDS = 1.0
+_health_cache: tuple[float, dict] = (0.0, {})
+
+# Fields that never change while the process runs
+_STATIC_HEALTH = {
+    "status": "healthy",
+    "app": settings.app_name,
+    "version": settings.app_version,
+}
+
 
 @router.get("/health")
 async def health_check():
@@ -15,9 +29,17 @@ async def health_check():
     Health check endpoint.
 
     Returns backend status, version, component info, MongoDB sync status,
-    and the current user ID.
-    Used by Electron to verify backend is running.
+    database pool counters, and the current user ID.
+    Used by Electron to verify backend is running. The payload is cached
+    for HEALTH_CACHE_TTL_SECONDS. It is built without awaiting, so
+    concurrent polls cannot stampede the rebuild.
     """
+    global _health_cache
+    now = time.monotonic()
+    cached_at, payload = _health_cache
+    if payload and now - cached_at < HEALTH_CACHE_TTL_SECONDS:
+        return payload
+
     registry = ComponentRegistry.get_instance()
     components = registry.get_all()
 
@@ -33,12 +55,11 @@ async def health_check():
     user_manager = get_user_manager()
     user_id = user_manager.get_user_id() if user_manager else None
 
-    return {
-        "status": "healthy",
-        "app": settings.app_name,
-        "version": settings.app_version,
+    payload = {
+        **_STATIC_HEALTH,
         "user_id": user_id,
         "mongodb_sync": mongodb_status,
+        "database_pool": get_pool_status(),
         "components": {
             name: {
                 "version": comp.version,
@@ -48,3 +69,5 @@ async def health_check():
         },
         "component_count": len(components),
     }
+    _health_cache = (now, payload)
+    return payload
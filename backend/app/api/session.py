@@ -5,15 +5,24 @@ from datetime import datetime
 from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import select, func
+from sqlalchemy import bindparam, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
-from app.models.activity import BrowserSession, ActivityEvent
+from app.models.activity import BrowserSession
 from app.schemas.session import SessionCreate, SessionResponse, SessionUpdate
 
 router = APIRouter()
 
+# Built once; per-request values are bound parameters
+_STMT_SESSION_BY_ID = select(BrowserSession).where(BrowserSession.session_id == bindparam("session_id"))
+_STMT_CURRENT_SESSION = (
+    select(BrowserSession)
+    .where(BrowserSession.status == "active")
+    .order_by(BrowserSession.start_time.desc())
+    .limit(1)
+)
+
 
 @router.post("", response_model=SessionResponse)
 async def create_session(
@@ -52,31 +61,19 @@ async def create_session(
 @router.get("/current", response_model=Optional[SessionResponse])
 async def get_current_session(db: AsyncSession = Depends(get_db)):
     """Get the current active session, if any."""
-    result = await db.execute(
-        select(BrowserSession)
-        .where(BrowserSession.status == "active")
-        .order_by(BrowserSession.start_time.desc())
-        .limit(1)
-    )
+    result = await db.execute(_STMT_CURRENT_SESSION)
     session = result.scalar_one_or_none()
 
     if not session:
         return None
 
-    # Count activities
-    count_result = await db.execute(
-        select(func.count(ActivityEvent.id))
-        .where(ActivityEvent.session_id == session.session_id)
-    )
-    activity_count = count_result.scalar() or 0
-
     return SessionResponse(
         session_id=session.session_id,
         user_id=session.user_id,
         start_time=session.start_time,
         end_time=session.end_time,
         status=session.status,
-        activity_count=activity_count,
+        activity_count=session.activity_count,
     )
 
 
@@ -86,28 +83,19 @@ async def get_session(
     db: AsyncSession = Depends(get_db)
 ):
     """Get a specific session by ID."""
-    result = await db.execute(
-        select(BrowserSession).where(BrowserSession.session_id == session_id)
-    )
+    result = await db.execute(_STMT_SESSION_BY_ID, {"session_id": session_id})
     session = result.scalar_one_or_none()
 
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
 
-    # Count activities
-    count_result = await db.execute(
-        select(func.count(ActivityEvent.id))
-        .where(ActivityEvent.session_id == session.session_id)
-    )
-    activity_count = count_result.scalar() or 0
-
     return SessionResponse(
         session_id=session.session_id,
         user_id=session.user_id,
         start_time=session.start_time,
         end_time=session.end_time,
         status=session.status,
-        activity_count=activity_count,
+        activity_count=session.activity_count,
     )
 
 
@@ -118,9 +106,7 @@ async def update_session(
     db: AsyncSession = Depends(get_db)
 ):
     """Update a session (e.g., pause, resume, end)."""
-    result = await db.execute(
-        select(BrowserSession).where(BrowserSession.session_id == session_id)
-    )
+    result = await db.execute(_STMT_SESSION_BY_ID, {"session_id": session_id})
     session = result.scalar_one_or_none()
 
     if not session:
@@ -137,20 +123,13 @@ async def update_session(
     await db.commit()
     await db.refresh(session)
 
-    # Count activities
-    count_result = await db.execute(
-        select(func.count(ActivityEvent.id))
-        .where(ActivityEvent.session_id == session.session_id)
-    )
-    activity_count = count_result.scalar() or 0
-
     return SessionResponse(
         session_id=session.session_id,
         user_id=session.user_id,
         start_time=session.start_time,
         end_time=session.end_time,
         status=session.status,
-        activity_count=activity_count,
+        activity_count=session.activity_count,
     )
 
 
@@ -160,9 +139,7 @@ async def end_session(
     db: AsyncSession = Depends(get_db)
 ):
     """End a session."""
-    result = await db.execute(
-        select(BrowserSession).where(BrowserSession.session_id == session_id)
-    )
+    result = await db.execute(_STMT_SESSION_BY_ID, {"session_id": session_id})
     session = result.scalar_one_or_none()
 
     if not session:
@@ -174,18 +151,11 @@ async def end_session(
     await db.commit()
     await db.refresh(session)
 
-    # Count activities
-    count_result = await db.execute(
-        select(func.count(ActivityEvent.id))
-        .where(ActivityEvent.session_id == session.session_id)
-    )
-    activity_count = count_result.scalar() or 0
-
     return SessionResponse(
         session_id=session.session_id,
         user_id=session.user_id,
         start_time=session.start_time,
         end_time=session.end_time,
         status=session.status,
-        activity_count=activity_count,
+        activity_count=session.activity_count,
     )
@@ -73,13 +73,47 @@ class ComponentBase(ABC):
         This is called for each unit of work (e.g., each activity event).
 
         Args:
-            data: Input data dictionary
+            data: Input data mapping (treat as read-only; the pipeline may
+                pass a view shared with other components)
 
         Returns:
             Output data dictionary
         """
         pass
 
+    def process_batch(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Process several units of work in one call.
+
+        The default implementation calls process() for each item.
+        Components override this when they can amortize work across
+        a batch (e.g., vectorized model inference).
+
+        Args:
+            items: List of input data dictionaries
+
+        Returns:
+            List of output dictionaries, in the same order as items
+        """
+        return [self.process(item) for item in items]
+
+    def process_validated_batch(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Process a batch whose items were already validated upstream.
+
+        Callers use this when items are built from a Pydantic schema that
+        was validated at the API boundary, so components may skip their
+        own input validation. The default implementation defers to
+        process_batch().
+
+        Args:
+            items: List of input data dictionaries with validated fields
+
+        Returns:
+            List of output dictionaries, in the same order as items
+        """
+        return self.process_batch(items)
+
     @abstractmethod
     def get_status(self) -> Dict[str, Any]:
         """
@@ -13,8 +13,14 @@ Classification Categories:
 - non_academic: Entertainment, social media, gaming
 """
 
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 import logging
+import re
+import sys
+import threading
+
+from pydantic import TypeAdapter, ValidationError
 
 from app.components.base import ComponentBase
 from .schemas import ClassificationInput, ClassificationOutput
@@ -145,6 +151,206 @@ DESKTOP_NEUTRAL_APPS = {
     "settings", "control panel", "task manager", "activity monitor",
 }
 
+# Freeze the rule sets with interned members: they are never mutated, and
+# interned strings compare by identity when the sets are combined below
+ACADEMIC_DOMAINS = frozenset(map(sys.intern, ACADEMIC_DOMAINS))
+PRODUCTIVITY_DOMAINS = frozenset(map(sys.intern, PRODUCTIVITY_DOMAINS))
+NON_ACADEMIC_DOMAINS = frozenset(map(sys.intern, NON_ACADEMIC_DOMAINS))
+DESKTOP_PRODUCTIVITY_APPS = frozenset(map(sys.intern, DESKTOP_PRODUCTIVITY_APPS))
+DESKTOP_ACADEMIC_APPS = frozenset(map(sys.intern, DESKTOP_ACADEMIC_APPS))
+DESKTOP_NON_ACADEMIC_APPS = frozenset(map(sys.intern, DESKTOP_NON_ACADEMIC_APPS))
+DESKTOP_NEUTRAL_APPS = frozenset(map(sys.intern, DESKTOP_NEUTRAL_APPS))
+
+
+def _fast_lower(text: str) -> str:
+    """Lowercase text, reusing the same object when it is already lowercase."""
+    return text if text.islower() else text.lower()
+
+
+def _compile_patterns(patterns) -> "re.Pattern":
+    """
+    Compile a pattern set into one alternation of escaped literals.
+
+    re.search() then finds whether any pattern occurs in the input with a
+    single C-level scan, instead of a Python loop of `pattern in text`
+    checks. Longer patterns come first so the reported match is the most
+    specific one at a position.
+    """
+    ordered = sorted(patterns, key=lambda p: (-len(p), p))
+    return re.compile("|".join(re.escape(p) for p in ordered))
+
+
+def _rule_table(patterns, category: str, confidence: float, rule_prefix: str) -> Dict[str, tuple]:
+    """
+    Precompute the (category, confidence, matched_rule) result per pattern.
+
+    Matches return these shared tuples as-is, so no rule string is
+    formatted per event; category names are interned singletons.
+    """
+    category = sys.intern(category)
+    return {
+        p: (category, confidence, sys.intern(f"{rule_prefix}:{p}"))
+        for p in patterns
+    }
+
+
+ACADEMIC_DOMAIN_RULES = _rule_table(ACADEMIC_DOMAINS, "academic", 0.85, "academic_domain")
+PRODUCTIVITY_DOMAIN_RULES = _rule_table(PRODUCTIVITY_DOMAINS, "productivity", 0.80, "productivity_domain")
+NON_ACADEMIC_DOMAIN_RULES = _rule_table(NON_ACADEMIC_DOMAINS, "non_academic", 0.85, "non_academic_domain")
+
+ACADEMIC_DOMAINS_RE = _compile_patterns(ACADEMIC_DOMAIN_RULES)
+
+
+def _build_domain_suffix_trie(rules) -> Dict[str, Any]:
+    """
+    Build a trie of domain labels, walked from the TLD inward.
+
+    rules maps a dotted domain (e.g. "github.com") to its classification
+    tuple; the tuple is stored under the "$" key of the node for its
+    leftmost label.
+    """
+    trie: Dict[str, Any] = {}
+    for pattern, rule in rules.items():
+        node = trie
+        for label in reversed(pattern.split(".")):
+            node = node.setdefault(label, {})
+        node["$"] = rule
+    return trie
+
+
+# Dotted productivity / non-academic patterns match as domain suffixes on
+# label boundaries ("www.github.com" but not "notgithub.com")
+DOMAIN_SUFFIX_TRIE = _build_domain_suffix_trie({
+    **{p: rule for p, rule in PRODUCTIVITY_DOMAIN_RULES.items() if "." in p},
+    **{p: rule for p, rule in NON_ACADEMIC_DOMAIN_RULES.items() if "." in p},
+})
+# Bare keywords (e.g. "confluence") still match anywhere in the domain
+PRODUCTIVITY_KEYWORDS_RE = _compile_patterns(p for p in PRODUCTIVITY_DOMAINS if "." not in p)
+# Fast reject: one scan tells whether any substring rule can match the domain
+BROWSER_SUBSTRINGS_RE = _compile_patterns(
+    ACADEMIC_DOMAINS | {p for p in PRODUCTIVITY_DOMAINS if "." not in p}
+)
+
+
+def _walk_domain_suffix_trie(labels: List[str]) -> Optional[tuple]:
+    """Return the rule for the longest pattern that is a suffix of labels."""
+    node = DOMAIN_SUFFIX_TRIE
+    rule = None
+    for label in reversed(labels):
+        node = node.get(label)
+        if node is None:
+            break
+        rule = node.get("$", rule)
+    return rule
+
+
+def _match_domain_suffix(domain: str) -> Optional[tuple]:
+    """
+    Return the rule for the longest pattern that is a label suffix of domain.
+
+    A pattern followed by a two-letter country-code label also matches, so
+    regional hosts such as amazon.com.au or github.com.au keep their rule.
+    """
+    labels = domain.split(".")
+    rule = _walk_domain_suffix_trie(labels)
+    if rule is None and len(labels) > 2:
+        cctld = labels[-1]
+        if len(cctld) == 2 and cctld.isalpha():
+            rule = _walk_domain_suffix_trie(labels[:-1])
+    return rule
+
+
+DESKTOP_ACADEMIC_APP_RULES = _rule_table(DESKTOP_ACADEMIC_APPS, "academic", 0.90, "desktop_academic_app")
+DESKTOP_PRODUCTIVITY_APP_RULES = _rule_table(DESKTOP_PRODUCTIVITY_APPS, "productivity", 0.85, "desktop_productivity_app")
+DESKTOP_NON_ACADEMIC_APP_RULES = _rule_table(DESKTOP_NON_ACADEMIC_APPS, "non_academic", 0.85, "desktop_non_academic_app")
+DESKTOP_NEUTRAL_APP_RULES = _rule_table(DESKTOP_NEUTRAL_APPS, "neutral", 0.70, "desktop_neutral_app")
+
+DESKTOP_ACADEMIC_APPS_RE = _compile_patterns(DESKTOP_ACADEMIC_APP_RULES)
+DESKTOP_PRODUCTIVITY_APPS_RE = _compile_patterns(DESKTOP_PRODUCTIVITY_APP_RULES)
+DESKTOP_NON_ACADEMIC_APPS_RE = _compile_patterns(DESKTOP_NON_ACADEMIC_APP_RULES)
+DESKTOP_NEUTRAL_APPS_RE = _compile_patterns(DESKTOP_NEUTRAL_APP_RULES)
+
+
+def _match_desktop_app(app_name: str) -> Optional[tuple]:
+    """Match an app name against the desktop app sets, in priority order."""
+    # Check academic apps first
+    match = DESKTOP_ACADEMIC_APPS_RE.search(app_name)
+    if match:
+        return DESKTOP_ACADEMIC_APP_RULES[match.group()]
+
+    # Check productivity apps
+    match = DESKTOP_PRODUCTIVITY_APPS_RE.search(app_name)
+    if match:
+        return DESKTOP_PRODUCTIVITY_APP_RULES[match.group()]
+
+    # Check non-academic apps
+    match = DESKTOP_NON_ACADEMIC_APPS_RE.search(app_name)
+    if match:
+        return DESKTOP_NON_ACADEMIC_APP_RULES[match.group()]
+
+    # Check neutral apps (browsers, file managers)
+    match = DESKTOP_NEUTRAL_APPS_RE.search(app_name)
+    if match:
+        return DESKTOP_NEUTRAL_APP_RULES[match.group()]
+
+    return None
+
+
+# Results for app names that equal a pattern, precomputed with the same
+# substring rules so a hit is identical to the full scan
+DESKTOP_APP_EXACT = {
+    name: _match_desktop_app(name)
+    for name in (
+        DESKTOP_ACADEMIC_APPS | DESKTOP_PRODUCTIVITY_APPS
+        | DESKTOP_NON_ACADEMIC_APPS | DESKTOP_NEUTRAL_APPS
+    )
+}
+
+# Checked with a single str.endswith(tuple) call
+EDUCATIONAL_TLDS = (".edu", ".ac.uk", ".edu.au")
+
+# Title keyword heuristics (inputs are already lowercased)
+TITLE_ACADEMIC_RE = _compile_patterns(
+    ["lecture", "course", "study", "research", "thesis", "paper"]
+)
+DESKTOP_TITLE_ACADEMIC_RE = _compile_patterns(
+    ["lecture", "course", "study", "research", "thesis", "paper", "assignment"]
+)
+DESKTOP_TITLE_PRODUCTIVITY_RE = _compile_patterns(
+    ["document", "spreadsheet", "presentation", "project", "work", "meeting"]
+)
+DESKTOP_TITLE_ENTERTAINMENT_RE = _compile_patterns(
+    ["game", "play", "video", "movie", "music", "stream"]
+)
+YOUTUBE_EDU_RE = _compile_patterns(
+    ["tutorial", "lecture", "course", "learn", "explained",
+     "how to", "education", "university", "professor"]
+)
+YOUTUBE_ENTERTAINMENT_RE = _compile_patterns(
+    ["gameplay", "funny", "prank", "vlog", "reaction"]
+)
+GOOGLE_QUERY_ACADEMIC_RE = _compile_patterns([
+    "research", "paper", "study", "learn", "learning", "course", "tutorial",
+    "education", "university", "scholar", "academic", "thesis", "journal",
+    "lecture", "homework", "assignment", "exam", "textbook", "chapter",
+    "definition", "explain", "theory", "formula", "equation", "solve",
+    "science", "math", "physics", "chemistry", "biology", "history",
+])
+GOOGLE_QUERY_PRODUCTIVITY_RE = _compile_patterns([
+    "code", "coding", "programming", "developer", "development",
+    "documentation", "api", "github", "stackoverflow", "debug",
+    "error", "function", "class", "method", "algorithm", "data structure",
+    "software", "framework", "library", "package", "install", "deploy",
+])
+
+# Reused validators for process()/process_batch(); avoid per-call model
+# construction overhead
+_INPUT_ADAPTER = TypeAdapter(ClassificationInput)
+_BATCH_INPUT_ADAPTER = TypeAdapter(List[ClassificationInput])
+
+# Max (domain, url, title) / (app, window title) rule results kept in memory
+RULE_CACHE_SIZE = 4096
+
 # Idle activity classifications for user-reported offline activities
 # Maps activity_id -> (category, confidence)
 IDLE_ACTIVITY_CLASSIFICATIONS = {
@@ -197,7 +403,6 @@ class ClassificationComponent(ComponentBase):
 
         # Enhanced statistics tracking
         self._stats = {
-            "total_classified": 0,
             "by_layer": {
                 "rules": 0,
                 "model": 0,
@@ -223,6 +428,12 @@ class ClassificationComponent(ComponentBase):
                 "failures": 0,
             },
         }
+        # Direct references to the hot counters (one dict lookup per update);
+        # get_status derives total_classified from by_category
+        self._layer_counts = self._stats["by_layer"]
+        self._category_counts = self._stats["by_category"]
+        # Batches classify on worker threads; += on the counters is not atomic
+        self._stats_lock = threading.Lock()
 
     @property
     def name(self) -> str:
@@ -314,24 +525,77 @@ class ClassificationComponent(ComponentBase):
 
         # Parse input
         try:
-            input_data = ClassificationInput(**data)
+            input_data = _INPUT_ADAPTER.validate_python(data)
         except Exception as e:
             # Fallback for malformed input
             return self._create_fallback_output(f"Parse error: {str(e)}")
 
+        return self._classify(input_data, data)
+
+    def process_batch(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Classify several activities in one call.
+
+        Validates the whole batch with a single list validator call, then
+        runs the rule/ML layers per item. If any item is malformed, falls
+        back to process() per item so each bad item gets its own fallback
+        output.
+
+        Args:
+            items: List of activity data dictionaries
+
+        Returns:
+            List of ClassificationOutput dicts, in the same order as items
+        """
+        if not self._initialized:
+            raise RuntimeError("Component not initialized")
+
+        try:
+            inputs = _BATCH_INPUT_ADAPTER.validate_python(items)
+        except ValidationError:
+            return [self.process(item) for item in items]
+
+        classify = self._classify
+        return [classify(input_data, data) for input_data, data in zip(inputs, items)]
+
+    def process_validated_batch(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Classify activities whose fields were validated at the API boundary.
+
+        Skips the ClassificationInput validation pass: inputs are built
+        with model_construct, which only assigns fields and defaults.
+        Items must already carry correctly typed values (e.g. copied
+        from a validated ActivityEventCreate); use process_batch()
+        for anything else.
+
+        Args:
+            items: List of activity data dictionaries
+
+        Returns:
+            List of ClassificationOutput dicts, in the same order as items
+        """
+        if not self._initialized:
+            raise RuntimeError("Component not initialized")
+
+        construct = ClassificationInput.model_construct
+        classify = self._classify
+        return [classify(construct(**data), data) for data in items]
+
+    def _classify(self, input_data: ClassificationInput, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Run the classification layers on validated input (see process)."""
         source = data.get("source", "browser")
 
         # LAYER 1: Rule-based classification
         if source == "desktop":
             # Desktop app classification
-            app_name = data.get("app_name", "").lower()
-            window_title = data.get("window_title", "").lower()
+            app_name = _fast_lower(data.get("app_name") or "")
+            window_title = _fast_lower(data.get("window_title") or "")
             category, confidence, matched_rule = self._classify_desktop_app(app_name, window_title)
         else:
             # Browser classification
-            domain = input_data.domain.lower()
-            url = input_data.url.lower()
-            title = input_data.title.lower()
+            domain = _fast_lower(input_data.domain)
+            url = _fast_lower(input_data.url)
+            title = _fast_lower(input_data.title)
 
             # Apply rule-based classification
             category, confidence, matched_rule = self._classify_by_rules(domain, url, title)
@@ -347,7 +611,6 @@ class ClassificationComponent(ComponentBase):
         if confidence >= 0.80:
             # LAYER 1: High confidence from rules - use directly
             source_type = "rules"
-            self._stats["by_layer"]["rules"] += 1
 
         elif self._should_use_ml(confidence):
             # LAYER 2: Try ML classification for uncertain cases
@@ -363,82 +626,76 @@ class ClassificationComponent(ComponentBase):
                 confidence = ml_result["confidence"]
                 matched_rule = ml_result.get("explanation", "ml_classification")
                 source_type = "model"
-                self._stats["by_layer"]["model"] += 1
             else:
                 # ML failed or low confidence - Mark as pending for batch Gemini classification
                 category = "neutral"  # Temporary placeholder
                 confidence = 0.40
                 matched_rule = "Awaiting batch Gemini classification"
                 source_type = "pending_ai"
-                self._stats["by_layer"]["pending_ai"] += 1
         else:
             # No ML available, use rule result or pending_ai handling
             if confidence >= 0.50:
                 source_type = "rules"
-                self._stats["by_layer"]["rules"] += 1
             else:
                 # Mark as pending for batch Gemini classification
                 category = "neutral"  # Temporary placeholder
                 confidence = 0.40
                 matched_rule = "Awaiting batch Gemini classification"
                 source_type = "pending_ai"
-                self._stats["by_layer"]["pending_ai"] += 1
 
         # Update stats
-        self._stats["total_classified"] += 1
-        self._stats["by_category"][category] += 1
+        with self._stats_lock:
+            self._layer_counts[source_type] += 1
+            self._category_counts[category] += 1
 
-        output = ClassificationOutput(
-            category=category,
-            confidence=confidence,
-            source=source_type,
-            matched_rule=matched_rule,
-        )
+        # Same shape as ClassificationOutput.model_dump(), built directly:
+        # every field here comes from the rule tables or the classifiers
+        return {
+            "category": category,
+            "confidence": confidence,
+            "source": source_type,
+            "matched_rule": matched_rule,
+            "explanation": None,
+        }
 
-        return output.model_dump()
+    @staticmethod
+    @lru_cache(maxsize=RULE_CACHE_SIZE)
+    def _classify_desktop_app(app_name: str, window_title: str) -> tuple:
+        """
+        Classify desktop applications by app name and window title.
 
-    def _classify_desktop_app(self, app_name: str, window_title: str) -> tuple:
-        """Classify desktop applications by app name and window title."""
+        Pure function of its arguments; results are LRU-cached because the
+        same app/window pair repeats across consecutive events.
+        """
 
         # Remove .exe extension if present
         app_name_clean = app_name.replace(".exe", "").strip()
 
-        # Check academic apps first
-        for pattern in DESKTOP_ACADEMIC_APPS:
-            if pattern in app_name_clean:
-                return "academic", 0.90, f"desktop_academic_app:{pattern}"
-
-        # Check productivity apps
-        for pattern in DESKTOP_PRODUCTIVITY_APPS:
-            if pattern in app_name_clean:
-                return "productivity", 0.85, f"desktop_productivity_app:{pattern}"
-
-        # Check non-academic apps
-        for pattern in DESKTOP_NON_ACADEMIC_APPS:
-            if pattern in app_name_clean:
-                return "non_academic", 0.85, f"desktop_non_academic_app:{pattern}"
-
-        # Check neutral apps (browsers, file managers)
-        for pattern in DESKTOP_NEUTRAL_APPS:
-            if pattern in app_name_clean:
-                return "neutral", 0.70, f"desktop_neutral_app:{pattern}"
+        # Most app names are a known pattern verbatim: one dict lookup
+        rule = DESKTOP_APP_EXACT.get(app_name_clean)
+        if rule is None:
+            rule = _match_desktop_app(app_name_clean)
+        if rule:
+            return rule
 
         # Window title-based heuristics for unknown apps
-        academic_keywords = ["lecture", "course", "study", "research", "thesis", "paper", "assignment"]
-        if any(kw in window_title for kw in academic_keywords):
+        if DESKTOP_TITLE_ACADEMIC_RE.search(window_title):
             return "academic", 0.65, "desktop_title_academic"
 
-        productivity_keywords = ["document", "spreadsheet", "presentation", "project", "work", "meeting"]
-        if any(kw in window_title for kw in productivity_keywords):
+        if DESKTOP_TITLE_PRODUCTIVITY_RE.search(window_title):
             return "productivity", 0.60, "desktop_title_productivity"
 
-        entertainment_keywords = ["game", "play", "video", "movie", "music", "stream"]
-        if any(kw in window_title for kw in entertainment_keywords):
+        if DESKTOP_TITLE_ENTERTAINMENT_RE.search(window_title):
             return "non_academic", 0.65, "desktop_title_entertainment"
 
         # Default to neutral for unknown apps
         return "neutral", 0.50, "desktop_unknown_app"
 
+    def _count_category(self, category: str) -> None:
+        """Count a classification outside the layered pipeline."""
+        with self._stats_lock:
+            self._category_counts[category] += 1
+
     def classify_idle_activity(self, activity_id: str = None, custom_label: str = None) -> Dict[str, Any]:
         """
         Classify a user-reported idle/offline activity.
@@ -456,8 +713,7 @@ class ClassificationComponent(ComponentBase):
         # Predefined activity lookup
         if activity_id and activity_id in IDLE_ACTIVITY_CLASSIFICATIONS:
             category, confidence = IDLE_ACTIVITY_CLASSIFICATIONS[activity_id]
-            self._stats["total_classified"] += 1
-            self._stats["by_category"][category] += 1
+            self._count_category(category)
             return {
                 "category": category,
                 "confidence": confidence,
@@ -472,8 +728,7 @@ class ClassificationComponent(ComponentBase):
 
             # Check for academic keywords
             if words & IDLE_ACADEMIC_KEYWORDS:
-                self._stats["total_classified"] += 1
-                self._stats["by_category"]["academic"] += 1
+                self._count_category("academic")
                 return {
                     "category": "academic",
                     "confidence": 0.70,
@@ -483,8 +738,7 @@ class ClassificationComponent(ComponentBase):
 
             # Check for non-academic keywords
             if words & IDLE_NON_ACADEMIC_KEYWORDS:
-                self._stats["total_classified"] += 1
-                self._stats["by_category"]["non_academic"] += 1
+                self._count_category("non_academic")
                 return {
                     "category": "non_academic",
                     "confidence": 0.70,
@@ -493,8 +747,7 @@ class ClassificationComponent(ComponentBase):
                 }
 
             # Fallback for unknown custom text
-            self._stats["total_classified"] += 1
-            self._stats["by_category"]["neutral"] += 1
+            self._count_category("neutral")
             return {
                 "category": "neutral",
                 "confidence": 0.50,
@@ -510,31 +763,44 @@ class ClassificationComponent(ComponentBase):
             "matched_rule": "idle_no_activity",
         }
 
-    def _classify_by_rules(self, domain: str, url: str, title: str) -> tuple:
-        """Apply rule-based classification for browser events."""
+    @staticmethod
+    @lru_cache(maxsize=RULE_CACHE_SIZE)
+    def _classify_by_rules(domain: str, url: str, title: str) -> tuple:
+        """
+        Apply rule-based classification for browser events.
 
-        # Check academic domains
-        for pattern in ACADEMIC_DOMAINS:
-            if pattern in domain or pattern in url:
-                return "academic", 0.85, f"academic_domain:{pattern}"
+        Pure function of its arguments; results are LRU-cached because the
+        same tab produces many events with identical domain/url/title.
+        """
 
-        # Check productivity domains
-        for pattern in PRODUCTIVITY_DOMAINS:
-            if pattern in domain:
-                return "productivity", 0.80, f"productivity_domain:{pattern}"
+        # Most domains match no substring rule: one combined scan skips the
+        # per-category scans, leaving only the academic URL check
+        if BROWSER_SUBSTRINGS_RE.search(domain):
+            # Check academic domains
+            match = ACADEMIC_DOMAINS_RE.search(domain) or ACADEMIC_DOMAINS_RE.search(url)
+            if match:
+                return ACADEMIC_DOMAIN_RULES[match.group()]
+
+            # Check productivity keywords
+            match = PRODUCTIVITY_KEYWORDS_RE.search(domain)
+            if match:
+                return PRODUCTIVITY_DOMAIN_RULES[match.group()]
+        else:
+            match = ACADEMIC_DOMAINS_RE.search(url)
+            if match:
+                return ACADEMIC_DOMAIN_RULES[match.group()]
 
-        # Check non-academic domains
-        for pattern in NON_ACADEMIC_DOMAINS:
-            if pattern in domain:
-                return "non_academic", 0.85, f"non_academic_domain:{pattern}"
+        # Check productivity / non-academic domains (one walk over the labels)
+        rule = _match_domain_suffix(domain)
+        if rule:
+            return rule
 
         # Check educational TLDs
-        if any(domain.endswith(tld) for tld in [".edu", ".ac.uk", ".edu.au"]):
+        if domain.endswith(EDUCATIONAL_TLDS):
             return "academic", 0.90, "educational_tld"
 
         # Title-based heuristics
-        academic_keywords = ["lecture", "course", "study", "research", "thesis", "paper"]
-        if any(kw in title for kw in academic_keywords):
+        if TITLE_ACADEMIC_RE.search(title):
             return "academic", 0.65, "title_keywords"
 
         # Default to neutral for unknown domains
@@ -549,14 +815,11 @@ class ClassificationComponent(ComponentBase):
         title = context.get("titleForClassification", "").lower()
 
         # Educational YouTube content
-        edu_keywords = ["tutorial", "lecture", "course", "learn", "explained",
-                        "how to", "education", "university", "professor"]
-        if any(kw in title for kw in edu_keywords):
+        if YOUTUBE_EDU_RE.search(title):
             return "academic", 0.70
 
         # Entertainment keywords
-        entertainment_keywords = ["gameplay", "funny", "prank", "vlog", "reaction"]
-        if any(kw in title for kw in entertainment_keywords):
+        if YOUTUBE_ENTERTAINMENT_RE.search(title):
             return "non_academic", 0.75
 
         # Default YouTube to non-academic (entertainment)
@@ -577,29 +840,12 @@ class ClassificationComponent(ComponentBase):
             # Analyze search query for academic/productivity keywords
             query = context.get("query", "").lower()
 
-            # Academic keywords
-            academic_keywords = [
-                "research", "paper", "study", "learn", "learning", "course", "tutorial",
-                "education", "university", "scholar", "academic", "thesis", "journal",
-                "lecture", "homework", "assignment", "exam", "textbook", "chapter",
-                "definition", "explain", "theory", "formula", "equation", "solve",
-                "science", "math", "physics", "chemistry", "biology", "history"
-            ]
-
-            # Productivity/work keywords
-            productivity_keywords = [
-                "code", "coding", "programming", "developer", "development",
-                "documentation", "api", "github", "stackoverflow", "debug",
-                "error", "function", "class", "method", "algorithm", "data structure",
-                "software", "framework", "library", "package", "install", "deploy"
-            ]
-
             # Check for academic keywords
-            if query and any(keyword in query for keyword in academic_keywords):
+            if query and GOOGLE_QUERY_ACADEMIC_RE.search(query):
                 return "academic", 0.70
 
             # Check for productivity keywords
-            if query and any(keyword in query for keyword in productivity_keywords):
+            if query and GOOGLE_QUERY_PRODUCTIVITY_RE.search(query):
                 return "productivity", 0.70
 
             # Default to neutral for generic searches
@@ -648,27 +894,25 @@ class ClassificationComponent(ComponentBase):
                 self._ml_enabled = False
                 return None
 
+        ml_stats = self._stats["ml_stats"]
         try:
-            self._stats["ml_stats"]["calls"] += 1
-
             result = self._ml_classifier.classify(url, title, domain)
+        except Exception as e:
+            logging.error(f"[Classification] ML classification error: {e}")
+            result = None
 
+        with self._stats_lock:
+            ml_stats["calls"] += 1
             if result:
-                self._stats["ml_stats"]["successes"] += 1
+                ml_stats["successes"] += 1
                 # Update rolling average confidence
-                total = self._stats["ml_stats"]["successes"]
-                current_avg = self._stats["ml_stats"]["avg_confidence"]
-                new_avg = (current_avg * (total - 1) + result["confidence"]) / total
-                self._stats["ml_stats"]["avg_confidence"] = new_avg
+                total = ml_stats["successes"]
+                current_avg = ml_stats["avg_confidence"]
+                ml_stats["avg_confidence"] = (current_avg * (total - 1) + result["confidence"]) / total
             else:
-                self._stats["ml_stats"]["failures"] += 1
-
-            return result
+                ml_stats["failures"] += 1
 
-        except Exception as e:
-            logging.error(f"[Classification] ML classification error: {e}")
-            self._stats["ml_stats"]["failures"] += 1
-            return None
+        return result
 
     def _classify_with_gemini(self, url: str, title: str, domain: str) -> Optional[Dict]:
         """
@@ -694,22 +938,18 @@ class ClassificationComponent(ComponentBase):
                 logging.error(f"[Classification] Gemini init failed: {e}")
                 return None
 
+        gemini_stats = self._stats["gemini_stats"]
         try:
-            self._stats["gemini_stats"]["calls"] += 1
-
             result = self._gemini_classifier.classify(url, title, domain)
-
-            if result:
-                self._stats["gemini_stats"]["successes"] += 1
-            else:
-                self._stats["gemini_stats"]["failures"] += 1
-
-            return result
-
         except Exception as e:
             logging.error(f"[Classification] Gemini classification error: {e}")
-            self._stats["gemini_stats"]["failures"] += 1
-            return None
+            result = None
+
+        with self._stats_lock:
+            gemini_stats["calls"] += 1
+            gemini_stats["successes" if result else "failures"] += 1
+
+        return result
 
     def _create_fallback_output(self, reason: str) -> Dict[str, Any]:
         """
@@ -747,7 +987,10 @@ class ClassificationComponent(ComponentBase):
             "initialized": self._initialized,
             "type": comp_type,
             "model_loaded": self._ml_classifier._initialized if self._ml_classifier else False,
-            "stats": self._stats,
+            "stats": {
+                "total_classified": sum(self._category_counts.values()),
+                **self._stats,
+            },
             "rules": {
                 # Browser domain rules
                 "browser_academic_patterns": len(ACADEMIC_DOMAINS),
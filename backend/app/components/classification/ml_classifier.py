@@ -28,6 +28,7 @@ Research Notes:
 
 from typing import Dict, Optional, Tuple
 import logging
+import threading
 from collections import OrderedDict
 
 
@@ -36,7 +37,8 @@ class LRUCache:
     Simple Least Recently Used (LRU) cache implementation.
 
     Maintains a fixed-size cache with automatic eviction of least
-    recently used entries when capacity is reached.
+    recently used entries when capacity is reached. Safe to share
+    between classification threads.
     """
 
     def __init__(self, max_size: int = 10000):
@@ -48,6 +50,7 @@ class LRUCache:
         """
         self.cache = OrderedDict()
         self.max_size = max_size
+        self._lock = threading.Lock()
 
     def get(self, key: str) -> Optional[Dict]:
         """
@@ -59,11 +62,12 @@ class LRUCache:
         Returns:
             Cached value or None if not found
         """
-        if key in self.cache:
-            # Move to end (most recent)
-            self.cache.move_to_end(key)
-            return self.cache[key]
-        return None
+        with self._lock:
+            if key in self.cache:
+                # Move to end (most recent)
+                self.cache.move_to_end(key)
+                return self.cache[key]
+            return None
 
     def put(self, key: str, value: Dict) -> None:
         """
@@ -73,20 +77,22 @@ class LRUCache:
             key: Cache key
             value: Value to cache
         """
-        if key in self.cache:
-            # Update existing
-            self.cache.move_to_end(key)
-            self.cache[key] = value
-        else:
-            # Add new entry
-            if len(self.cache) >= self.max_size:
-                # Remove oldest (first item)
-                self.cache.popitem(last=False)
-            self.cache[key] = value
+        with self._lock:
+            if key in self.cache:
+                # Update existing
+                self.cache.move_to_end(key)
+                self.cache[key] = value
+            else:
+                # Add new entry
+                if len(self.cache) >= self.max_size:
+                    # Remove oldest (first item)
+                    self.cache.popitem(last=False)
+                self.cache[key] = value
 
     def clear(self) -> None:
         """Clear all cache entries."""
-        self.cache.clear()
+        with self._lock:
+            self.cache.clear()
 
     def __len__(self) -> int:
         """Return cache size."""
@@ -131,6 +137,7 @@ class MLClassifier:
 
         self._classifier = None
         self._initialized = False
+        self._init_lock = threading.Lock()  # one model load across threads
         self._cache = LRUCache(max_size=10000)
 
         # Category descriptions for zero-shot classification
@@ -159,29 +166,34 @@ class MLClassifier:
         if self._initialized:
             return
 
-        try:
-            logging.info(f"[MLClassifier] Loading model: {self.model_name}")
-            logging.info("[MLClassifier] This may take 15-30 seconds on first load...")
+        # Concurrent first requests wait here for a single load
+        with self._init_lock:
+            if self._initialized:
+                return
 
-            from transformers import pipeline
-            import torch
+            try:
+                logging.info(f"[MLClassifier] Loading model: {self.model_name}")
+                logging.info("[MLClassifier] This may take 15-30 seconds on first load...")
 
-            # Determine device
-            device = 0 if self.device == "cuda" and torch.cuda.is_available() else -1
+                from transformers import pipeline
+                import torch
 
-            # Load zero-shot classification pipeline
-            self._classifier = pipeline(
-                "zero-shot-classification",
-                model=self.model_name,
-                device=device,
-            )
+                # Determine device
+                device = 0 if self.device == "cuda" and torch.cuda.is_available() else -1
 
-            self._initialized = True
-            logging.info("[MLClassifier] Model loaded successfully")
+                # Load zero-shot classification pipeline
+                self._classifier = pipeline(
+                    "zero-shot-classification",
+                    model=self.model_name,
+                    device=device,
+                )
 
-        except Exception as e:
-            logging.error(f"[MLClassifier] Failed to load model: {e}")
-            raise
+                self._initialized = True
+                logging.info("[MLClassifier] Model loaded successfully")
+
+            except Exception as e:
+                logging.error(f"[MLClassifier] Failed to load model: {e}")
+                raise
 
     def classify(
         self, url: str, title: str, domain: str = ""
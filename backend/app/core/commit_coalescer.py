@@ -0,0 +1,129 @@
+"""
+/core/commit_coalescer.py
+Write-behind commit coalescing for SQLite.
+
+SQLite allows a single writer and fsyncs on every commit, so committing
+once per HTTP request becomes the bottleneck under bursty extension
+traffic. Request handlers instead submit a write job; a background task
+gathers the jobs that arrive within a short window, runs them in one
+shared transaction and commits once.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, List, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import write_session_maker
+
+WriteJob = Callable[[AsyncSession], Awaitable[Any]]
+
+
+class CommitCoalescer:
+    """
+    Runs write jobs from concurrent requests in one transaction.
+
+    A job is an async callable that receives the shared AsyncSession and
+    performs its inserts/updates without committing. Jobs must be safe to
+    re-run: if the shared transaction fails, it is rolled back and every job
+    is retried in its own transaction so one bad job cannot fail the rest.
+    Jobs should also be idempotent against their own committed rows (e.g.
+    insert ... ON CONFLICT DO NOTHING and derive follow-up rows from what
+    was actually inserted), so a replay never duplicates data.
+    """
+
+    MAX_WAIT_SECONDS = 0.02  # latency budget added to a request
+    MAX_JOBS = 64
+
+    def __init__(self) -> None:
+        self._queue: asyncio.Queue[Tuple[WriteJob, asyncio.Future]] = asyncio.Queue()
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        """Start the background committer."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the background committer after committing queued jobs."""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        jobs = []
+        while not self._queue.empty():
+            jobs.append(self._queue.get_nowait())
+        if jobs:
+            await self._commit(jobs)
+
+    async def submit(self, job: WriteJob) -> Any:
+        """
+        Queue a write job and wait until its transaction has committed.
+
+        Runs the job in its own transaction when the committer is not
+        running (e.g. scripts that never start the app lifespan).
+
+        Returns:
+            The job's return value
+        """
+        future = asyncio.get_running_loop().create_future()
+        if self._task is None:
+            await self._commit([(job, future)])
+        else:
+            self._queue.put_nowait((job, future))
+        return await future
+
+    async def _run(self) -> None:
+        """Collect jobs for up to MAX_WAIT_SECONDS, then commit them together."""
+        loop = asyncio.get_running_loop()
+        jobs: List[Tuple[WriteJob, asyncio.Future]] = []
+        try:
+            while True:
+                jobs = [await self._queue.get()]
+                deadline = loop.time() + self.MAX_WAIT_SECONDS
+
+                while len(jobs) < self.MAX_JOBS:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        jobs.append(await asyncio.wait_for(self._queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+
+                await self._commit(jobs)
+                jobs = []
+        except asyncio.CancelledError:
+            # Hand uncommitted jobs back so stop() can commit them
+            for item in jobs:
+                self._queue.put_nowait(item)
+            raise
+
+    async def _commit(self, jobs: List[Tuple[WriteJob, asyncio.Future]]) -> None:
+        """Run jobs in one transaction; on failure retry each job on its own."""
+        try:
+            async with write_session_maker() as session:
+                results = [await job(session) for job, _ in jobs]
+                await session.commit()
+        except Exception as e:
+            if len(jobs) == 1:
+                future = jobs[0][1]
+                if not future.done():
+                    future.set_exception(e)
+                return
+            print(f"[CommitCoalescer] Shared commit of {len(jobs)} jobs failed, retrying individually: {e}")
+            for item in jobs:
+                await self._commit([item])
+            return
+
+        for (_, future), result in zip(jobs, results):
+            if not future.done():
+                future.set_result(result)
+
+
+# Global coalescer instance
+commit_coalescer = CommitCoalescer()
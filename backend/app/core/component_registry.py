@@ -1,6 +1,6 @@
 """Component registry for plugin system."""
 
-from typing import Dict, Optional, Any, TYPE_CHECKING
+from typing import Any, Callable, Dict, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from app.components.base import ComponentBase
@@ -16,11 +16,19 @@ class ComponentRegistry:
 
     _instance: Optional["ComponentRegistry"] = None
     _components: Dict[str, "ComponentBase"] = {}
+    _call_cache: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = {}
+    _version: int = 0
 
     def __new__(cls) -> "ComponentRegistry":
         if cls._instance is None:
             cls._instance = super().__new__(cls)
             cls._instance._components = {}
+            # Bound process() per component, so call() is one dict lookup
+            cls._instance._call_cache = {}
+            # Bound dict lookup backing get()
+            cls._instance._get = cls._instance._components.get
+            # Bumped on every register/unregister so callers can cache topology
+            cls._instance._version = 0
         return cls._instance
 
     @classmethod
@@ -33,17 +41,21 @@ class ComponentRegistry:
     def register(self, component: "ComponentBase") -> None:
         """Register a component."""
         self._components[component.name] = component
+        self._call_cache[component.name] = component.process
+        self._version += 1
         print(f"[Registry] Registered component: {component.name} v{component.version}")
 
     def unregister(self, name: str) -> None:
         """Unregister a component."""
         if name in self._components:
             del self._components[name]
+            self._call_cache.pop(name, None)
+            self._version += 1
             print(f"[Registry] Unregistered component: {name}")
 
     def get(self, name: str) -> Optional["ComponentBase"]:
         """Get a component by name."""
-        return self._components.get(name)
+        return self._get(name)
 
     def get_all(self) -> Dict[str, "ComponentBase"]:
         """Get all registered components."""
@@ -63,10 +75,11 @@ class ComponentRegistry:
         Raises:
             ValueError: If the component is not found
         """
-        component = self.get(component_name)
-        if not component:
-            raise ValueError(f"Component '{component_name}' not found")
-        return component.process(data)
+        try:
+            process = self._call_cache[component_name]
+        except KeyError:
+            raise ValueError(f"Component '{component_name}' not found") from None
+        return process(data)
 
     def get_all_status(self) -> Dict[str, Dict[str, Any]]:
         """Get status of all registered components."""
@@ -2,6 +2,7 @@
 /core/database.py
 SQLite database connection and session management."""
 
+from sqlalchemy import event, inspect, text
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
 from typing import AsyncGenerator
@@ -19,8 +20,63 @@ engine = create_async_engine(
     settings.database_url,
     echo=settings.debug,
     future=True,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_timeout=settings.db_pool_timeout,
+    pool_recycle=settings.db_pool_recycle,
+    query_cache_size=1200,  # compiled-statement cache (default 500)
 )
 
+# Execution option marking connections whose transactions BEGIN explicitly
+EXPLICIT_BEGIN_OPTION = "sqlite_explicit_begin"
+
+
+@event.listens_for(engine.sync_engine, "connect")
+def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """
+    Tune each new SQLite connection.
+
+    WAL lets the pooled readers run alongside the single writer instead of
+    blocking on it, and synchronous=NORMAL drops the fsync per commit
+    (still durable across application crashes in WAL mode).
+    """
+    if engine.dialect.name != "sqlite":
+        return
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")  # 256 MB
+    cursor.close()
+
+
+@event.listens_for(engine.sync_engine, "begin")
+def _begin_sqlite_transaction(conn) -> None:
+    """
+    BEGIN the commit coalescer's transactions explicitly.
+
+    The sqlite3 driver does not BEGIN until the first DML statement, so a
+    SAVEPOINT issued first would open the transaction itself and its
+    RELEASE would commit for real. Connections bound through
+    write_session_maker therefore take transaction control from the driver
+    and BEGIN IMMEDIATE, holding the write lock from the start.
+
+    All other sessions keep the driver's lazy BEGIN: a deferred BEGIN before
+    their first SELECT would pin a read snapshot, and a write after another
+    commit landed would then fail with "database is locked".
+    """
+    if conn.dialect.name != "sqlite":
+        return
+    dbapi_connection = conn.connection.dbapi_connection
+    if conn.get_execution_options().get(EXPLICIT_BEGIN_OPTION):
+        if dbapi_connection.isolation_level is not None:
+            dbapi_connection.isolation_level = None
+        conn.exec_driver_sql("BEGIN IMMEDIATE")
+    elif dbapi_connection.isolation_level is None:
+        # Pooled connection last used by the coalescer
+        dbapi_connection.isolation_level = ""
+
+
 # Session factory
 async_session_maker = async_sessionmaker(
     engine,
@@ -28,11 +84,77 @@ async_session_maker = async_sessionmaker(
     expire_on_commit=False,
 )
 
+# Session factory for the commit coalescer's write transactions (see
+# _begin_sqlite_transaction); shares the pool with async_session_maker
+write_session_maker = async_sessionmaker(
+    engine.execution_options(**{EXPLICIT_BEGIN_OPTION: True}),
+    class_=AsyncSession,
+    expire_on_commit=False,
+)
+
+
+def _create_missing_indexes(sync_conn) -> None:
+    """Create indexes added to models after their table already existed."""
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(sync_conn, checkfirst=True)
+
+
+def _add_session_activity_count(sync_conn) -> None:
+    """Add and backfill browser_sessions.activity_count on databases created before it existed."""
+    columns = {c["name"] for c in inspect(sync_conn).get_columns("browser_sessions")}
+    if "activity_count" in columns:
+        return
+
+    sync_conn.execute(text(
+        "ALTER TABLE browser_sessions ADD COLUMN activity_count INTEGER NOT NULL DEFAULT 0"
+    ))
+    sync_conn.execute(text(
+        "UPDATE browser_sessions SET activity_count = ("
+        "SELECT count(*) FROM activity_events "
+        "WHERE activity_events.session_id = browser_sessions.session_id)"
+    ))
+    print("[Database] Added browser_sessions.activity_count")
+
+
+# Keep browser_sessions.activity_count in step with activity_events inside
+# SQLite itself: rows skipped by ON CONFLICT DO NOTHING never fire the insert
+# trigger, and the batch insert needs no follow-up UPDATE statement.
+_ACTIVITY_COUNT_TRIGGERS = (
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_activity_events_count_insert
+    AFTER INSERT ON activity_events
+    WHEN NEW.session_id IS NOT NULL
+    BEGIN
+        UPDATE browser_sessions SET activity_count = activity_count + 1
+        WHERE session_id = NEW.session_id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_activity_events_count_delete
+    AFTER DELETE ON activity_events
+    WHEN OLD.session_id IS NOT NULL
+    BEGIN
+        UPDATE browser_sessions SET activity_count = activity_count - 1
+        WHERE session_id = OLD.session_id;
+    END
+    """,
+)
+
+
+def _create_activity_count_triggers(sync_conn) -> None:
+    """Install the activity_count triggers (idempotent)."""
+    for ddl in _ACTIVITY_COUNT_TRIGGERS:
+        sync_conn.execute(text(ddl))
+
 
 async def init_db() -> None:
     """Initialize database - create all tables."""
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(_create_missing_indexes)
+        await conn.run_sync(_add_session_activity_count)
+        await conn.run_sync(_create_activity_count_triggers)
     print(f"[Database] Initialized at {settings.database_url}")
 
 
@@ -42,6 +164,17 @@ async def close_db() -> None:
     print("[Database] Connection closed")
 
 
+def get_pool_status() -> dict:
+    """Connection pool counters for the health endpoint."""
+    pool = engine.pool
+    return {
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+        "checked_in": pool.checkedin(),
+    }
+
+
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """Dependency that provides a database session."""
     async with async_session_maker() as session:
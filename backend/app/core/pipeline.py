@@ -1,8 +1,25 @@
 """Component pipeline orchestration."""
 
-from typing import Dict, Any, List, Optional
+import asyncio
+from collections import ChainMap
+from typing import Any, Callable, Dict, List, Mapping, NamedTuple, Optional, Tuple
 from app.core.component_registry import ComponentRegistry
 
+# Upper bound on cached plans; stale versions are dropped wholesale
+PLAN_CACHE_SIZE = 64
+
+
+class ExecutionPlan(NamedTuple):
+    """Everything run() needs for one start component, resolved up front."""
+
+    order: List[str]
+    # name -> (bound process method, dependency names)
+    steps: Dict[str, Tuple[Callable[[Mapping[str, Any]], Dict[str, Any]], Tuple[str, ...]]]
+    # Components with no in-plan dependencies, started immediately
+    roots: Tuple[str, ...]
+    in_degree: Dict[str, int]
+    dependents: Dict[str, List[str]]
+
 
 class Pipeline:
     """
@@ -12,10 +29,18 @@ class Pipeline:
     they run in the correct order, passing outputs between them.
     """
 
+    __slots__ = ("registry", "_plan_cache", "_subtree_cache", "_subtree_version")
+
     def __init__(self):
         self.registry = ComponentRegistry.get_instance()
-
-    def run(
+        # (start_component, registry version) -> plan
+        self._plan_cache: Dict[Tuple[str, int], ExecutionPlan] = {}
+        # component -> execution order of its dependency closure, valid
+        # for registry version _subtree_version; shared across start points
+        self._subtree_cache: Dict[str, List[str]] = {}
+        self._subtree_version = -1
+
+    async def run(
         self,
         start_component: str,
         data: Dict[str, Any],
@@ -24,80 +49,193 @@ class Pipeline:
         """
         Run the pipeline starting from a component.
 
+        Components whose dependencies have all finished run concurrently;
+        each process() call runs in a worker thread so CPU-bound work does
+        not block the event loop.
+
         Args:
             start_component: The component to start with
-            data: Initial input data
-            stop_after: Optional component to stop after
+            data: Initial input data, validated once at the API boundary
+                (e.g. a model_dump() of the request schema) and passed to
+                every component as-is
+            stop_after: Optional component to stop after (components
+                already running when it finishes are allowed to complete)
 
         Returns:
             Accumulated results from all components
         """
         results: Dict[str, Any] = {"input": data}
-        execution_order = self._resolve_order(start_component)
-
-        for component_name in execution_order:
-            component = self.registry.get(component_name)
-            if not component:
-                continue
+        plan = self._plan(start_component)
+        steps = plan.steps
+        dependents = plan.dependents
+        in_degree = plan.in_degree.copy()
+
+        def start(name: str) -> asyncio.Task:
+            process, deps = steps[name]
+            return asyncio.create_task(
+                self._run_component(name, process, deps, data, results)
+            )
+
+        running = {start(name): name for name in plan.roots}
+        stopped = False
+        while running:
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                name = running.pop(task)
+                if stop_after and name == stop_after:
+                    stopped = True
+                if stopped:
+                    continue
+                for dependent in dependents[name]:
+                    in_degree[dependent] -= 1
+                    if in_degree[dependent] == 0:
+                        running[start(dependent)] = dependent
 
-            # Build input for this component
-            component_input = self._build_input(component_name, data, results)
-
-            # Execute component
-            try:
-                output = component.process(component_input)
-                results[component_name] = output
-            except Exception as e:
-                results[f"{component_name}_error"] = str(e)
-                print(f"[Pipeline] Error in {component_name}: {e}")
+        return results
 
-            if stop_after and component_name == stop_after:
-                break
+    async def _run_component(
+        self,
+        component_name: str,
+        process: Callable[[Mapping[str, Any]], Dict[str, Any]],
+        deps: Tuple[str, ...],
+        data: Dict[str, Any],
+        results: Dict[str, Any]
+    ) -> None:
+        """Execute one component and record its output (or error) in results."""
+        # Build input for this component
+        component_input = self._build_input(deps, data, results)
+
+        # Execute component
+        try:
+            output = await asyncio.to_thread(process, component_input)
+            results[component_name] = output
+        except Exception as e:
+            results[f"{component_name}_error"] = str(e)
+            print(f"[Pipeline] Error in {component_name}: {e}")
+
+    def _plan(self, start: str) -> ExecutionPlan:
+        """
+        Return the cached execution plan for a start component.
 
-        return results
+        Components are resolved to their bound process() methods here, so
+        a run does no registry lookups. The plan is keyed on the registry
+        version, so registering or unregistering a component invalidates it.
+        """
+        key = (start, self.registry._version)
+        plan = self._plan_cache.get(key)
+        if plan is not None:
+            return plan
+
+        order = self._resolve_order(start)
+        get = self.registry.get
+        steps = {}
+        for name in order:
+            component = get(name)
+            steps[name] = (component.process, tuple(component.dependencies))
+
+        # Kahn's algorithm inputs over the resolved subgraph
+        in_degree: Dict[str, int] = {}
+        dependents: Dict[str, List[str]] = {name: [] for name in order}
+        for name in order:
+            deps = [d for d in steps[name][1] if d in dependents]
+            in_degree[name] = len(deps)
+            for dep in deps:
+                dependents[dep].append(name)
+
+        if len(self._plan_cache) >= PLAN_CACHE_SIZE:
+            self._plan_cache.clear()
+        roots = tuple(name for name in order if in_degree[name] == 0)
+        plan = ExecutionPlan(order, steps, roots, in_degree, dependents)
+        self._plan_cache[key] = plan
+        return plan
 
     def _resolve_order(self, start: str) -> List[str]:
         """
         Resolve component execution order based on dependencies.
         Uses topological sort.
         """
-        visited = set()
-        order = []
+        return self._subtree(start)
 
-        def visit(name: str):
-            if name in visited:
-                return
-            visited.add(name)
+    def _subtree(self, name: str) -> List[str]:
+        """
+        Return the execution order of a component and its dependencies.
 
-            component = self.registry.get(name)
-            if component:
-                for dep in component.dependencies:
-                    visit(dep)
-                order.append(name)
+        Each component's order is its dependencies' orders merged (first
+        occurrence wins) followed by itself, memoized per component, so
+        prerequisites shared by several start points are walked once.
+        The walk uses an explicit stack instead of recursion.
 
-        visit(start)
-        return order
+        Raises:
+            ValueError: If the dependencies contain a cycle. Only complete
+                subtrees are ever cached, so the cache stays valid.
+        """
+        version = self.registry._version
+        if version != self._subtree_version:
+            self._subtree_cache.clear()
+            self._subtree_version = version
+
+        cache = self._subtree_cache
+        cached = cache.get(name)
+        if cached is not None:
+            return cached
+
+        get = self.registry.get
+        component = get(name)
+        if not component:
+            return []
+
+        in_progress = {name}
+        stack = [(name, component.dependencies, iter(component.dependencies))]
+
+        while stack:
+            current, deps, remaining = stack[-1]
+            for dep in remaining:
+                if dep in in_progress:
+                    path = [entry[0] for entry in stack]
+                    cycle = path[path.index(dep):] + [dep]
+                    raise ValueError(f"Circular dependency detected: {' -> '.join(cycle)}")
+                if dep in cache:
+                    continue
+                dep_component = get(dep)
+                if not dep_component:
+                    cache[dep] = []
+                    continue
+                in_progress.add(dep)
+                stack.append((dep, dep_component.dependencies, iter(dep_component.dependencies)))
+                break
+            else:
+                stack.pop()
+                in_progress.discard(current)
+
+                order: List[str] = []
+                seen = set()
+                for dep in deps:
+                    for dep_name in cache.get(dep, ()):
+                        if dep_name not in seen:
+                            seen.add(dep_name)
+                            order.append(dep_name)
+                if current not in seen:
+                    order.append(current)
+                cache[current] = order
+
+        return cache[name]
 
     def _build_input(
         self,
-        component_name: str,
+        deps: Tuple[str, ...],
         original_data: Dict[str, Any],
         results: Dict[str, Any]
-    ) -> Dict[str, Any]:
-        """Build input for a component from original data and previous results."""
-        component = self.registry.get(component_name)
-        if not component:
-            return original_data
-
-        # Start with original data
-        component_input = original_data.copy()
-
-        # Add outputs from dependencies
-        for dep in component.dependencies:
-            if dep in results:
-                component_input[dep] = results[dep]
+    ) -> Mapping[str, Any]:
+        """
+        Build input for a component from original data and previous results.
 
-        return component_input
+        Returns a read-only view layering dependency outputs over the
+        original data rather than a copy; components must not mutate it.
+        """
+        dep_map = {dep: results[dep] for dep in deps if dep in results}
+        if not dep_map:
+            return original_data
+        return ChainMap(dep_map, original_data)
 
 
 # Global pipeline instance
@@ -0,0 +1,20 @@
+"""
+/core/responses.py
+JSON response class backed by orjson.
+
+FastAPI's JSONResponse renders with the standard library json module.
+orjson serializes the same content several times faster and natively
+handles datetime values, which the activity endpoints return in bulk.
+"""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse that renders its content with orjson."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
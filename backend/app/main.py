@@ -21,9 +21,11 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 
 from app.config import settings
 from app.core.database import init_db, close_db
+from app.core.commit_coalescer import commit_coalescer
 from app.components import load_all_components
 from app.api import api_router
 from app.services.user_manager import init_user_manager
@@ -38,6 +40,7 @@ async def lifespan(app: FastAPI):
     # Startup
     print(f"[Backend] Starting {settings.app_name} v{settings.app_version}")
     await init_db()
+    commit_coalescer.start()
     load_all_components(settings.component_config)
 
     # Initialize user manager
@@ -76,6 +79,7 @@ async def lifespan(app: FastAPI):
     stop_scheduler()
     if mongo_sync:
         await mongo_sync.close()
+    await commit_coalescer.stop()
     await close_db()
     print("[Backend] Goodbye!")
 
@@ -97,6 +101,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress larger responses (e.g. /activity/recent) for clients that accept gzip
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # Include API routes
 app.include_router(api_router, prefix=settings.api_prefix)
 
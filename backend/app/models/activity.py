@@ -1,26 +1,61 @@
 """SQLAlchemy models for activity tracking."""
 
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Boolean, JSON, Text
-from sqlalchemy.orm import relationship
+from typing import Any, List, Optional
+
+import orjson
+from pydantic import BaseModel
+from sqlalchemy import Integer, String, Float, DateTime, ForeignKey, Boolean, Text, Index
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.types import TypeDecorator
 
 from app.core.database import Base
 
 
+class ModelJSON(TypeDecorator):
+    """
+    JSON column that also accepts Pydantic models.
+
+    Models are serialized with model_dump_json (pydantic-core) and dicts
+    with orjson, skipping the intermediate dict + stdlib json round trip.
+    Stored as TEXT, which is how SQLite's JSON type persists values anyway.
+    """
+
+    impl = Text
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        if isinstance(value, BaseModel):
+            return value.model_dump_json()
+        return orjson.dumps(value).decode()
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return orjson.loads(value)
+
+
 class BrowserSession(Base):
     """Browser tracking session."""
 
     __tablename__ = "browser_sessions"
-
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    session_id = Column(String(36), unique=True, index=True, nullable=False)
-    user_id = Column(String(36), nullable=True)
-    start_time = Column(DateTime, nullable=False, default=datetime.utcnow)
-    end_time = Column(DateTime, nullable=True)
-    status = Column(String(20), default="active")  # active, paused, ended
+    __table_args__ = (
+        # Serves GET /session/current (latest active session)
+        Index("ix_browser_sessions_status_start_time", "status", "start_time"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    session_id: Mapped[str] = mapped_column(String(36), unique=True, index=True, nullable=False)
+    user_id: Mapped[Optional[str]] = mapped_column(String(36), nullable=True)
+    start_time: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
+    end_time: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    status: Mapped[Optional[str]] = mapped_column(String(20), default="active")  # active, paused, ended
+    activity_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")  # maintained by triggers on activity_events
 
     # Relationships
-    activities = relationship("ActivityEvent", back_populates="session", cascade="all, delete-orphan")
+    activities: Mapped[List["ActivityEvent"]] = relationship(back_populates="session", cascade="all, delete-orphan")
 
     def __repr__(self) -> str:
         return f"<BrowserSession {self.session_id} ({self.status})>"
@@ -31,14 +66,14 @@ class Classification(Base):
 
     __tablename__ = "classifications"
 
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    category = Column(String(50), nullable=False)  # academic, productivity, neutral, non_academic
-    confidence = Column(Float, nullable=False)
-    source = Column(String(50), nullable=False)  # stub, database, rules, model, user
-    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    category: Mapped[str] = mapped_column(String(50), nullable=False)  # academic, productivity, neutral, non_academic
+    confidence: Mapped[float] = mapped_column(Float, nullable=False)
+    source: Mapped[str] = mapped_column(String(50), nullable=False)  # stub, database, rules, model, user
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
 
     # Relationships
-    activities = relationship("ActivityEvent", back_populates="classification")
+    activities: Mapped[List["ActivityEvent"]] = relationship(back_populates="classification")
 
     def __repr__(self) -> str:
         return f"<Classification {self.category} ({self.confidence:.2f})>"
@@ -49,54 +84,54 @@ class ActivityEvent(Base):
 
     __tablename__ = "activity_events"
 
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    event_id = Column(String(36), unique=True, index=True, nullable=False)
-    user_id = Column(String(36), nullable=True, index=True)  # User identifier
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    event_id: Mapped[str] = mapped_column(String(36), unique=True, index=True, nullable=False)
+    user_id: Mapped[Optional[str]] = mapped_column(String(36), nullable=True, index=True)  # User identifier
 
     # Session reference
-    session_id = Column(String(36), ForeignKey("browser_sessions.session_id"), nullable=True, index=True)
+    session_id: Mapped[Optional[str]] = mapped_column(String(36), ForeignKey("browser_sessions.session_id"), nullable=True, index=True)
 
     # Source identification
-    source = Column(String(20), default="browser", index=True)  # browser, desktop
-    activity_type = Column(String(20), default="webpage")  # webpage, application
+    source: Mapped[Optional[str]] = mapped_column(String(20), default="browser", index=True)  # browser, desktop
+    activity_type: Mapped[Optional[str]] = mapped_column(String(20), default="webpage")  # webpage, application
 
     # Timestamps
-    timestamp = Column(DateTime, nullable=False, index=True)
-    start_time = Column(DateTime, nullable=False)
-    end_time = Column(DateTime, nullable=True)
+    timestamp: Mapped[datetime] = mapped_column(DateTime, nullable=False, index=True)
+    start_time: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    end_time: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
 
     # URL/Domain info (for browser events)
-    url = Column(Text, nullable=False)
-    domain = Column(String(255), nullable=False, index=True)
-    path = Column(String(1024), nullable=True)
-    title = Column(String(512), nullable=True)
+    url: Mapped[str] = mapped_column(Text, nullable=False)
+    domain: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
+    path: Mapped[Optional[str]] = mapped_column(String(1024), nullable=True)
+    title: Mapped[Optional[str]] = mapped_column(String(512), nullable=True)
 
     # Desktop-specific fields
-    app_name = Column(String(255), nullable=True, index=True)  # Application name (desktop only)
-    app_path = Column(Text, nullable=True)  # Application executable path (desktop only)
-    window_title = Column(String(512), nullable=True)  # Window title (desktop only)
+    app_name: Mapped[Optional[str]] = mapped_column(String(255), nullable=True, index=True)  # Application name (desktop only)
+    app_path: Mapped[Optional[str]] = mapped_column(Text, nullable=True)  # Application executable path (desktop only)
+    window_title: Mapped[Optional[str]] = mapped_column(String(512), nullable=True)  # Window title (desktop only)
 
     # Time tracking
-    active_time = Column(Integer, default=0)  # milliseconds
-    idle_time = Column(Integer, default=0)  # milliseconds
+    active_time: Mapped[Optional[int]] = mapped_column(Integer, default=0)  # milliseconds
+    idle_time: Mapped[Optional[int]] = mapped_column(Integer, default=0)  # milliseconds
 
     # Tab info (for browser events)
-    tab_id = Column(Integer, nullable=True)
-    window_id = Column(Integer, nullable=True)
-    is_incognito = Column(Boolean, default=False)
+    tab_id: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    window_id: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    is_incognito: Mapped[Optional[bool]] = mapped_column(Boolean, default=False)
 
     # Enrichment data (stored as JSON) - browser only
-    url_components = Column(JSON, nullable=True)
-    title_hints = Column(JSON, nullable=True)
-    engagement = Column(JSON, nullable=True)
-    context_data = Column(JSON, nullable=True)  # youtube, google, social context
+    url_components: Mapped[Any] = mapped_column(ModelJSON, nullable=True)
+    title_hints: Mapped[Any] = mapped_column(ModelJSON, nullable=True)
+    engagement: Mapped[Any] = mapped_column(ModelJSON, nullable=True)
+    context_data: Mapped[Any] = mapped_column(ModelJSON, nullable=True)  # youtube, google, social context
 
     # Classification reference
-    classification_id = Column(Integer, ForeignKey("classifications.id"), nullable=True)
+    classification_id: Mapped[Optional[int]] = mapped_column(Integer, ForeignKey("classifications.id"), nullable=True)
 
     # Relationships
-    session = relationship("BrowserSession", back_populates="activities")
-    classification = relationship("Classification", back_populates="activities")
+    session: Mapped[Optional["BrowserSession"]] = relationship(back_populates="activities")
+    classification: Mapped[Optional["Classification"]] = relationship(back_populates="activities")
 
     def __repr__(self) -> str:
         if self.source == "desktop":
@@ -1,6 +1,6 @@
 """Pydantic schemas for activity events."""
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, Dict, Any, List
 from datetime import datetime
 
@@ -15,8 +15,7 @@ class UrlComponents(BaseModel):
     query_params: Optional[Dict[str, str]] = Field(None, alias="queryParams")
     hash: Optional[str] = None
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True)
 
 
 class TitleHints(BaseModel):
@@ -27,8 +26,7 @@ class TitleHints(BaseModel):
     possible_search: Optional[bool] = Field(None, alias="possibleSearch")
     possible_docs: Optional[bool] = Field(None, alias="possibleDocs")
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True)
 
 
 class EngagementMetrics(BaseModel):
@@ -38,8 +36,7 @@ class EngagementMetrics(BaseModel):
     active_ratio: Optional[float] = Field(None, alias="activeRatio")
     was_engaged: Optional[bool] = Field(None, alias="wasEngaged")
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True)
 
 
 class YouTubeContext(BaseModel):
@@ -52,8 +49,7 @@ class YouTubeContext(BaseModel):
     search_query: Optional[str] = Field(None, alias="searchQuery")
     title_for_classification: Optional[str] = Field(None, alias="titleForClassification")
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True)
 
 
 class GoogleContext(BaseModel):
@@ -66,8 +62,7 @@ class GoogleContext(BaseModel):
     is_drive: Optional[bool] = Field(None, alias="isDrive")
     is_classroom: Optional[bool] = Field(None, alias="isClassroom")
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True)
 
 
 class SocialContext(BaseModel):
@@ -78,8 +73,7 @@ class SocialContext(BaseModel):
     is_messaging: Optional[bool] = Field(None, alias="isMessaging")
     possible_academic: Optional[bool] = Field(None, alias="possibleAcademic")
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True)
 
 
 class ActivityEventCreate(BaseModel):
@@ -120,8 +114,7 @@ class ActivityEventCreate(BaseModel):
     google_context: Optional[GoogleContext] = Field(None, alias="googleContext")
     social_context: Optional[SocialContext] = Field(None, alias="socialContext")
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True)
 
 
 class ClassificationResult(BaseModel):
@@ -140,8 +133,7 @@ class ActivityEventResponse(BaseModel):
     timestamp: datetime
     classification: Optional[ClassificationResult] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ActivityBatchRequest(BaseModel):
@@ -152,8 +144,7 @@ class ActivityBatchRequest(BaseModel):
     extension_version: str = Field(..., alias="extensionVersion")
     timestamp: datetime
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True)
 
 
 class ActivityBatchResponse(BaseModel):
@@ -4,7 +4,7 @@
 from datetime import datetime
 from typing import Optional, List
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class CalibrationCreate(BaseModel):
@@ -20,8 +20,7 @@ class CalibrationResponse(BaseModel):
     study_duration_hours: float
     updated_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class PatternResult(BaseModel):
@@ -1,6 +1,6 @@
 """Pydantic schemas for session management."""
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional
 from datetime import datetime
 
@@ -9,8 +9,7 @@ class SessionCreate(BaseModel):
     """Schema for creating a new session."""
     user_id: Optional[str] = Field(None, alias="userId")
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True)
 
 
 class SessionResponse(BaseModel):
@@ -22,8 +21,7 @@ class SessionResponse(BaseModel):
     status: str
     activity_count: int = 0
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class SessionUpdate(BaseModel):
@@ -39,5 +37,4 @@ class SessionMessage(BaseModel):
     user_id: Optional[str] = Field(None, alias="userId")
     status: str  # active, paused, ended
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True)
@@ -2,7 +2,7 @@
 
 import asyncio
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 from sqlalchemy import select
 from sqlalchemy.orm import selectinload
 
@@ -140,6 +140,7 @@ class GeminiBatchWorker:
             mongo_sync = get_mongodb_sync()
             if mongo_sync and updated_events:
                 mongo_docs = []
+                synced_at = datetime.now(timezone.utc)
                 for event, class_record in updated_events:
                     class_dict = {
                         "category": class_record.category,
@@ -178,10 +179,11 @@ class GeminiBatchWorker:
                         },
                         classification=class_dict,
                         user_id=event.user_id or "",
+                        synced_at=synced_at,
                     )
                     mongo_docs.append(doc)
                 
-                asyncio.create_task(mongo_sync.sync_batch(mongo_docs))
+                asyncio.create_task(mongo_sync.sync_batch(mongo_docs, upsert=True))
 
 # Global instance
 _worker = GeminiBatchWorker()
@@ -10,14 +10,73 @@ Design principles:
 - SQLite remains the primary local store; MongoDB is an async mirror.
 - If MongoDB is unreachable, data is still safely in SQLite.
 - Failed syncs are queued and retried automatically.
-- Writes are fire-and-forget — they never block the API response.
+- Writes are fire-and-forget — callers only enqueue, so they never
+  block the API response on a MongoDB round-trip.
+- Documents from many API batches are buffered and flushed together in
+  one bulk write (every FLUSH_MAX_DOCS docs or FLUSH_INTERVAL_SECONDS).
 """
 
 import asyncio
+from collections import deque
 from datetime import datetime, timezone
+from importlib.util import find_spec
 from typing import Any
 
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+
+# Server error code for a unique index violation
+DUPLICATE_KEY_ERROR = 11000
+
+# Top-level document fields copied from the event: (name, default)
+_DOCUMENT_FIELDS: tuple[tuple[str, Any], ...] = (
+    ("session_id", None),
+    ("source", "browser"),
+    ("activity_type", "webpage"),
+    ("timestamp", None),
+    ("start_time", None),
+    ("end_time", None),
+    ("url", ""),
+    ("domain", ""),
+    ("path", ""),
+    ("title", ""),
+    # Desktop-specific
+    ("app_name", None),
+    ("app_path", None),
+    ("window_title", None),
+    # Time tracking
+    ("active_time", 0),
+    ("idle_time", 0),
+)
+
+# Event fields nested under "enrichment"
+_ENRICHMENT_FIELDS: tuple[str, ...] = ("url_components", "title_hints", "engagement", "context_data")
+
+_now = datetime.now
+_UTC = timezone.utc
+
+
+def _wire_compressors() -> str:
+    """Wire compressors to offer, best first, skipping ones not installed.
+
+    pymongo warns on every client for a compressor whose library is
+    missing; zlib (stdlib) is always available as the fallback.
+    """
+    def installed(module: str) -> bool:
+        try:
+            return find_spec(module) is not None
+        except ImportError:  # missing parent package
+            return False
+
+    compressors = []
+    if installed("backports.zstd") or installed("zstandard"):
+        compressors.append("zstd")
+    if installed("snappy"):
+        compressors.append("snappy")
+    compressors.append("zlib")
+    return ",".join(compressors)
+
 
 # Module-level singleton
 _mongodb_sync: "MongoDBSyncService | None" = None
@@ -27,45 +86,94 @@ class MongoDBSyncService:
     """Async service for syncing activity events to MongoDB Atlas."""
 
     COLLECTION_NAME = "activity_events"
-    RETRY_INTERVAL_SECONDS = 60
+    MIN_RETRY_BACKOFF_SECONDS = 5  # retry interval while writes succeed
+    MAX_RETRY_BACKOFF_SECONDS = 300  # cap for the doubling backoff during outages
     MAX_RETRY_BATCH = 100
+    FLUSH_MAX_DOCS = 500
+    FLUSH_INTERVAL_SECONDS = 5
+    MAX_QUEUED_DOCS = 10_000  # buffer cap; overflow goes to the retry queue
+    MAX_RETRY_QUEUE = 100_000  # retry cap during long outages; oldest dropped first
+    MAX_CONCURRENT_WRITES = 4  # bulk writes in flight (well under the driver pool)
+
+    __slots__ = (
+        "_client",
+        "_db",
+        "_connected",
+        "_retry_queue",
+        "_retry_dropped",
+        "_retry_task",
+        "_retry_backoff",
+        "_retry_wake",
+        "_retry_pending",
+        "_queue",
+        "_write_semaphore",
+        "_flush_task",
+    )
 
     def __init__(self) -> None:
         self._client: AsyncIOMotorClient | None = None
         self._db: AsyncIOMotorDatabase | None = None
         self._connected: bool = False
-        self._retry_queue: list[dict[str, Any]] = []
+        self._retry_queue: deque[dict[str, Any]] = deque(maxlen=self.MAX_RETRY_QUEUE)
+        self._retry_dropped: int = 0
         self._retry_task: asyncio.Task | None = None
+        self._retry_backoff: float = self.MIN_RETRY_BACKOFF_SECONDS
+        self._retry_wake = asyncio.Event()
+        self._retry_pending = asyncio.Event()
+        self._queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue(maxsize=self.MAX_QUEUED_DOCS)
+        self._write_semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_WRITES)
+        self._flush_task: asyncio.Task | None = None
 
     async def initialize(self, uri: str, db_name: str) -> None:
         """Connect to MongoDB Atlas and set up indexes."""
+        # Start the buffered writer even if the connection fails: queued
+        # documents then fall through to the retry queue.
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_loop())
+
         try:
-            self._client = AsyncIOMotorClient(uri)
-            # Verify connection with a ping
-            await self._client.admin.command("ping")
+            # SQLite is the durable store, so an acknowledged write on the
+            # primary is enough: no majority/journal wait per bulk write.
+            self._client = AsyncIOMotorClient(
+                uri,
+                maxPoolSize=32,
+                minPoolSize=4,
+                w=1,
+                journal=False,
+                retryWrites=True,
+                compressors=_wire_compressors(),
+            )
             self._db = self._client[db_name]
-
-            # Create indexes for efficient querying
-            collection = self._db[self.COLLECTION_NAME]
-            await collection.create_index("event_id", unique=True)
-            await collection.create_index("user_id")
-            await collection.create_index("start_time")          # pipeline primary sort
-            await collection.create_index("timestamp")
-            await collection.create_index("domain")
-            await collection.create_index("source")
-            await collection.create_index([("user_id", 1), ("start_time", 1)])   # compound — pipeline
-            await collection.create_index([("user_id", 1), ("timestamp", -1)])
-
-            self._connected = True
-            print(f"[MongoSync] Connected to MongoDB Atlas, database: {db_name}")
-
-            # Start retry loop
-            self._retry_task = asyncio.create_task(self._retry_loop())
-
+            await self._connect()
         except Exception as e:
             print(f"[MongoSync] Failed to connect to MongoDB: {e}")
             self._connected = False
 
+        # Start retry loop; it also reconnects the same client if Atlas was
+        # unreachable at startup.
+        if self._retry_task is None:
+            self._retry_task = asyncio.create_task(self._retry_loop())
+
+    async def _connect(self) -> None:
+        """Ping the server, ensure indexes, and mark the service connected."""
+        # Verify connection with a ping
+        await self._client.admin.command("ping")
+
+        # Create indexes for efficient querying
+        collection = self._db[self.COLLECTION_NAME]
+        # Every read filters on user_id first, so the compound indexes
+        # cover it; each extra index costs a B-tree update per insert.
+        await asyncio.gather(
+            collection.create_index("event_id", unique=True),
+            collection.create_index("domain"),
+            collection.create_index("source"),
+            collection.create_index([("user_id", 1), ("start_time", 1)]),   # compound — pipeline
+            collection.create_index([("user_id", 1), ("timestamp", -1)]),
+        )
+
+        self._connected = True
+        print(f"[MongoSync] Connected to MongoDB Atlas, database: {self._db.name}")
+
     @property
     def is_connected(self) -> bool:
         """Whether the service is currently connected to MongoDB."""
@@ -77,37 +185,43 @@ class MongoDBSyncService:
         return len(self._retry_queue)
 
     async def sync_activity_event(self, document: dict[str, Any]) -> bool:
-        """Sync a single activity event document to MongoDB.
+        """Queue a single activity event document for MongoDB (non-blocking).
+
+        The document is handed to the background writer, which folds it into
+        the next bulk insert; the caller never waits on Atlas.
 
         Args:
             document: A fully formed MongoDB document (see build_document).
 
         Returns:
-            True if the document was synced, False if it was queued for retry.
+            True if the document was buffered for the writer, False if the
+            buffer was full and it went to the retry queue instead.
         """
-        if not self._connected or self._db is None:
-            self._retry_queue.append(document)
-            return False
-
         try:
-            collection = self._db[self.COLLECTION_NAME]
-            await collection.update_one(
-                {"event_id": document["event_id"]},
-                {"$set": document},
-                upsert=True,
-            )
+            self._queue.put_nowait(document)
             return True
-
-        except Exception as e:
-            print(f"[MongoSync] Failed to sync event {document.get('event_id')}: {e}")
-            self._retry_queue.append(document)
+        except asyncio.QueueFull:
+            self._spill_to_retry([document])
             return False
 
-    async def sync_batch(self, documents: list[dict[str, Any]]) -> dict[str, Any]:
+    async def sync_batch(
+        self,
+        documents: list[dict[str, Any]],
+        upsert: bool = False,
+    ) -> dict[str, Any]:
         """Sync a batch of activity event documents to MongoDB.
 
+        New events take the fast path: one unordered insert_many, a single
+        round-trip the server can apply in parallel. Events that turn out
+        to exist already (duplicate key) are upserted by event_id as a
+        follow-up; documents that failed for any other reason are queued
+        for retry.
+
         Args:
             documents: List of fully formed MongoDB documents.
+            upsert: Upsert every document by event_id instead of inserting
+                (used for retries and re-synced classifications, where
+                duplicates are expected).
 
         Returns:
             Dict with 'synced' count and 'failed' count.
@@ -116,68 +230,240 @@ class MongoDBSyncService:
             return {"synced": 0, "failed": 0}
 
         if not self._connected or self._db is None:
-            self._retry_queue.extend(documents)
+            self._queue_for_retry(documents)
             return {"synced": 0, "failed": len(documents)}
 
-        synced = 0
-        failed = 0
-
+        collection = self._db[self.COLLECTION_NAME]
         try:
-            collection = self._db[self.COLLECTION_NAME]
-            from pymongo import UpdateOne
-
-            operations = [
-                UpdateOne(
-                    {"event_id": doc["event_id"]},
-                    {"$set": doc},
-                    upsert=True,
-                )
-                for doc in documents
-            ]
-
-            result = await collection.bulk_write(operations, ordered=False)
-            synced = result.upserted_count + result.modified_count
-            failed = len(documents) - synced
-            print(f"[MongoSync] Batch synced: {synced} succeeded, {failed} failed")
+            if upsert:
+                failed_docs = await self._upsert_documents(collection, documents)
+            else:
+                failed_docs = []
+                duplicates = []
+                try:
+                    async with self._write_semaphore:
+                        await collection.insert_many(
+                            documents, ordered=False, bypass_document_validation=True
+                        )
+                except BulkWriteError as e:
+                    for err in e.details.get("writeErrors", []):
+                        doc = documents[err["index"]]
+                        if err.get("code") == DUPLICATE_KEY_ERROR:
+                            duplicates.append(doc)
+                        else:
+                            failed_docs.append(doc)
+                if duplicates:
+                    failed_docs += await self._upsert_documents(collection, duplicates)
 
         except Exception as e:
             print(f"[MongoSync] Batch sync error: {e}")
-            self._retry_queue.extend(documents)
-            failed = len(documents)
+            self._queue_for_retry(documents)
+            return {"synced": 0, "failed": len(documents)}
 
+        self._queue_for_retry(failed_docs)
+        failed = len(failed_docs)
+        synced = len(documents) - failed
+        print(f"[MongoSync] Batch synced: {synced} succeeded, {failed} failed")
         return {"synced": synced, "failed": failed}
 
-    async def _retry_loop(self) -> None:
-        """Background loop to retry failed syncs."""
-        while True:
-            await asyncio.sleep(self.RETRY_INTERVAL_SECONDS)
+    async def _upsert_documents(
+        self,
+        collection: Any,
+        documents: list[dict[str, Any]],
+    ) -> list[dict[str, Any]]:
+        """Upsert documents by event_id; return the ones that failed."""
+        # insert_many stamps an _id on every document it attempted, and
+        # $set-ing a fresh _id onto an existing event is rejected.
+        update_one = UpdateOne
+        operations = [
+            update_one(
+                {"event_id": doc["event_id"]},
+                {"$set": {k: v for k, v in doc.items() if k != "_id"} if "_id" in doc else doc},
+                upsert=True,
+            )
+            for doc in documents
+        ]
+        try:
+            async with self._write_semaphore:
+                await collection.bulk_write(
+                    operations, ordered=False, bypass_document_validation=True
+                )
+        except BulkWriteError as e:
+            return [documents[err["index"]] for err in e.details.get("writeErrors", [])]
+        return []
 
-            if not self._retry_queue or not self._connected:
-                continue
+    def enqueue(self, documents: list[dict[str, Any]]) -> None:
+        """Buffer documents for the background writer (non-blocking).
 
-            # Take a batch from the queue
-            batch = self._retry_queue[: self.MAX_RETRY_BATCH]
-            self._retry_queue = self._retry_queue[self.MAX_RETRY_BATCH :]
+        When the buffer is full (e.g. Atlas is slow or unreachable),
+        documents spill over to the retry queue instead of growing it.
+        """
+        overflow = []
+        for doc in documents:
+            try:
+                self._queue.put_nowait(doc)
+            except asyncio.QueueFull:
+                overflow.append(doc)
+        if overflow:
+            self._spill_to_retry(overflow)
 
-            print(f"[MongoSync] Retrying {len(batch)} failed documents...")
+    def _spill_to_retry(self, documents: list[dict[str, Any]]) -> None:
+        """Queue buffer overflow for retry and wake the retry loop.
+
+        A full buffer with a live connection means Atlas is merely behind,
+        so the retry loop should drain now rather than after its backoff.
+        """
+        self._queue_for_retry(documents)
+        if self._connected:
+            self._retry_wake.set()
+
+    def _queue_for_retry(self, documents: list[dict[str, Any]]) -> None:
+        """Append documents to the retry queue, dropping the oldest when full.
+
+        Also signals the idle retry loop that there is work again.
+        """
+        if not documents:
+            return
+        dropped = len(self._retry_queue) + len(documents) - self.MAX_RETRY_QUEUE
+        if dropped > 0:
+            self._retry_dropped += dropped
+            print(
+                f"[MongoSync] Retry queue full, dropped {dropped} oldest documents "
+                f"({self._retry_dropped} total)"
+            )
+        self._retry_queue.extend(documents)
+        self._retry_pending.set()
+
+    def _requeue_for_retry(self, batch: list[dict[str, Any]]) -> None:
+        """Put a batch taken from the retry queue back at its front.
+
+        The batch holds the oldest documents, so when the queue filled up in
+        the meantime the batch's own oldest documents are dropped (counted
+        like in _queue_for_retry), rather than the deque's maxlen silently
+        evicting the newest ones from the other end.
+        """
+        dropped = len(self._retry_queue) + len(batch) - self.MAX_RETRY_QUEUE
+        if dropped > 0:
+            self._retry_dropped += dropped
+            print(
+                f"[MongoSync] Retry queue full, dropped {dropped} oldest documents "
+                f"({self._retry_dropped} total)"
+            )
+            batch = batch[dropped:]
+        self._retry_queue.extendleft(reversed(batch))
+
+    async def _flush_loop(self) -> None:
+        """Background loop coalescing queued documents into bulk writes."""
+        loop = asyncio.get_running_loop()
+        docs: list[dict[str, Any]] = []
+        try:
+            while True:
+                docs = [await self._queue.get()]
+                deadline = loop.time() + self.FLUSH_INTERVAL_SECONDS
+
+                while len(docs) < self.FLUSH_MAX_DOCS:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        docs.append(await asyncio.wait_for(self._queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+
+                await self.sync_batch(docs)
+                docs = []
+        except asyncio.CancelledError:
+            # Hand in-flight documents back so close() can flush them
+            self.enqueue(docs)
+            raise
+
+    def _drain_queue(self) -> list[dict[str, Any]]:
+        """Remove and return everything currently buffered."""
+        docs = []
+        while not self._queue.empty():
+            docs.append(self._queue.get_nowait())
+        return docs
+
+    async def _retry_loop(self) -> None:
+        """Background loop to retry failed syncs.
+
+        Idles without a timeout while the retry queue is empty. Once failed
+        documents arrive it sleeps for the current backoff (or until woken
+        by buffer overflow), then drains the queue batch by batch without
+        pausing. The backoff resets after a successful batch and doubles,
+        up to MAX_RETRY_BACKOFF_SECONDS, while the server is unreachable or
+        writes keep failing.
+        """
+        # The deque and its methods never change; bind them once
+        queue = self._retry_queue
+        popleft = queue.popleft
+        max_batch = self.MAX_RETRY_BATCH
+        wake = self._retry_wake
+        pending = self._retry_pending
+        wait_for = asyncio.wait_for
+
+        while True:
+            # Nothing to retry: sleep until _queue_for_retry hands us work
+            pending.clear()
+            if not queue:
+                await pending.wait()
 
             try:
-                # Try to reconnect if needed
-                if self._client:
-                    await self._client.admin.command("ping")
-                    self._connected = True
-            except Exception:
-                self._connected = False
-                self._retry_queue = batch + self._retry_queue
-                print("[MongoSync] Still disconnected, will retry later")
+                await wait_for(wake.wait(), timeout=self._retry_backoff)
+            except asyncio.TimeoutError:
+                pass
+
+            if self._client is None:
+                # The client could not be created; keep the documents, back off
+                self._back_off()
                 continue
 
-            result = await self.sync_batch(batch)
-            if result["failed"] > 0:
-                print(f"[MongoSync] {result['failed']} documents still failing")
+            while queue:
+                # Take a batch from the queue
+                batch = [popleft() for _ in range(min(max_batch, len(queue)))]
+
+                print(f"[MongoSync] Retrying {len(batch)} failed documents...")
+
+                try:
+                    # Try to reconnect if needed
+                    if self._connected:
+                        await self._client.admin.command("ping")
+                    else:
+                        await self._connect()
+                except Exception:
+                    self._connected = False
+                    self._requeue_for_retry(batch)
+                    self._back_off()
+                    print(
+                        "[MongoSync] Still disconnected, will retry in "
+                        f"{self._retry_backoff:.0f}s"
+                    )
+                    break
+
+                result = await self.sync_batch(batch, upsert=True)
+                if result["failed"] > 0:
+                    self._back_off()
+                    print(f"[MongoSync] {result['failed']} documents still failing")
+                    break
+                self._retry_backoff = self.MIN_RETRY_BACKOFF_SECONDS
+
+            # Documents re-queued by this pass must not cut the backoff short
+            wake.clear()
+
+    def _back_off(self) -> None:
+        """Double the retry interval, up to the cap."""
+        self._retry_backoff = min(self._retry_backoff * 2, self.MAX_RETRY_BACKOFF_SECONDS)
 
     async def close(self) -> None:
-        """Close the MongoDB connection."""
+        """Flush buffered documents and close the MongoDB connection."""
+        if self._flush_task:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            await self.sync_batch(self._drain_queue())
+
         if self._retry_task:
             self._retry_task.cancel()
             try:
@@ -195,6 +481,7 @@ class MongoDBSyncService:
         event_data: dict[str, Any],
         classification: dict[str, Any] | None,
         user_id: str,
+        synced_at: datetime | None = None,
     ) -> dict[str, Any]:
         """Build a MongoDB document from event data.
 
@@ -205,43 +492,47 @@ class MongoDBSyncService:
             event_data: Dict of event fields (from Pydantic model).
             classification: Classification result dict or None.
             user_id: User identifier string.
+            synced_at: Sync timestamp; callers building several documents
+                pass one shared value. Defaults to now (UTC).
 
         Returns:
             A dict ready for MongoDB insertion.
         """
-        doc: dict[str, Any] = {
-            "event_id": event_data["event_id"],
-            "user_id": user_id,
-            "session_id": event_data.get("session_id"),
-            "source": event_data.get("source", "browser"),
-            "activity_type": event_data.get("activity_type", "webpage"),
-            "timestamp": event_data.get("timestamp"),
-            "start_time": event_data.get("start_time"),
-            "end_time": event_data.get("end_time"),
-            "url": event_data.get("url", ""),
-            "domain": event_data.get("domain", ""),
-            "path": event_data.get("path", ""),
-            "title": event_data.get("title", ""),
-            # Desktop-specific
-            "app_name": event_data.get("app_name"),
-            "app_path": event_data.get("app_path"),
-            "window_title": event_data.get("window_title"),
-            # Time tracking
-            "active_time": event_data.get("active_time", 0),
-            "idle_time": event_data.get("idle_time", 0),
-            # Classification (embedded)
-            "classification": classification,
-            # Enrichment data (embedded)
-            "enrichment": {
-                "url_components": event_data.get("url_components"),
-                "title_hints": event_data.get("title_hints"),
-                "engagement": event_data.get("engagement"),
-                "context_data": event_data.get("context_data"),
-            },
-            "synced_at": datetime.now(timezone.utc),
-        }
+        get = event_data.get
+        doc: dict[str, Any] = {"event_id": event_data["event_id"], "user_id": user_id}
+        doc.update({name: get(name, default) for name, default in _DOCUMENT_FIELDS})
+        # Classification and enrichment data (embedded)
+        doc["classification"] = classification
+        doc["enrichment"] = {name: get(name) for name in _ENRICHMENT_FIELDS}
+        doc["synced_at"] = synced_at or _now(_UTC)
         return doc
 
+    @staticmethod
+    def build_documents(
+        events: list[dict[str, Any]],
+        classifications: list[dict[str, Any] | None],
+        user_id: str,
+    ) -> list[dict[str, Any]]:
+        """Build MongoDB documents for a batch of events from one user.
+
+        Calls build_document per event with a single synced_at stamp
+        shared by the whole batch.
+
+        Args:
+            events: Dicts of event fields, one per event.
+            classifications: Classification dict (or None) per event.
+            user_id: User identifier string.
+
+        Returns:
+            Documents ready for MongoDB insertion, in input order.
+        """
+        build = MongoDBSyncService.build_document
+        synced_at = _now(_UTC)
+        return [
+            build(event_data, classification, user_id, synced_at=synced_at)
+            for event_data, classification in zip(events, classifications)
+        ]
+
 
 def init_mongodb_sync() -> MongoDBSyncService:
     """Create (once) and return the global MongoDBSyncService instance."""
@@ -262,7 +553,7 @@ async def ensure_pipeline_indexes(db: AsyncIOMotorDatabase) -> None:
     Safe to call on every startup — ``create_index`` is idempotent.
 
     Indexes created:
-      activity_events  : user_id, start_time, timestamp, (user_id, start_time)
+      activity_events  : (user_id, start_time), (user_id, timestamp)
       active_time      : unique (userId, date)
       procrastination_results   : unique (userId, date)
       predicted_active_time     : unique (userId, date)
@@ -270,20 +561,19 @@ async def ensure_pipeline_indexes(db: AsyncIOMotorDatabase) -> None:
       Task             : userId
     """
     events = db["activity_events"]
-    await events.create_index("user_id")
-    await events.create_index("start_time")
-    await events.create_index("timestamp")
-    await events.create_index([("user_id", 1), ("start_time", 1)])  # fast day-range queries
-    await events.create_index([("user_id", 1), ("timestamp", -1)])  # fallback sort
-
-    # Output collections — unique compound key mirrors upsert filter
-    for coll_name in ("active_time", "procrastination_results", "predicted_active_time"):
-        await db[coll_name].create_index(
-            [("userId", 1), ("date", 1)],
-            unique=True,
-            name=f"{coll_name}_userId_date_unique",
-        )
-
-    await db["user_calibration"].create_index("user_id")
-    await db["Task"].create_index("userId")
+    await asyncio.gather(
+        events.create_index([("user_id", 1), ("start_time", 1)]),  # fast day-range queries
+        events.create_index([("user_id", 1), ("timestamp", -1)]),  # fallback sort
+        # Output collections — unique compound key mirrors upsert filter
+        *(
+            db[coll_name].create_index(
+                [("userId", 1), ("date", 1)],
+                unique=True,
+                name=f"{coll_name}_userId_date_unique",
+            )
+            for coll_name in ("active_time", "procrastination_results", "predicted_active_time")
+        ),
+        db["user_calibration"].create_index("user_id"),
+        db["Task"].create_index("userId"),
+    )
 
@@ -18,27 +18,30 @@ class UserManager:
     Subsequent launches read the existing ID from the file.
     """
 
+    __slots__ = ("data_dir", "user_id_file", "_user_id")
+
     def __init__(self, data_dir: Path) -> None:
         self.data_dir = data_dir
         self.user_id_file = data_dir / "user_id.txt"
-        self._user_id: str | None = None
-
-    def get_user_id(self) -> str:
-        """Load existing user ID or create a new one."""
-        if self._user_id is not None:
-            return self._user_id
+        # Resolved once here; the ID never changes for the process lifetime
+        self._user_id: str = self._load_or_create_user_id()
 
+    def _load_or_create_user_id(self) -> str:
+        """Load existing user ID or create and persist a new one."""
         if self.user_id_file.exists():
             stored_id = self.user_id_file.read_text(encoding="utf-8").strip()
             if stored_id:
-                self._user_id = stored_id
-                return self._user_id
+                return stored_id
 
         # Generate new user ID
-        self._user_id = str(uuid.uuid4())
+        user_id = str(uuid.uuid4())
         self.data_dir.mkdir(parents=True, exist_ok=True)
-        self.user_id_file.write_text(self._user_id, encoding="utf-8")
-        print(f"[UserManager] Generated new user ID: {self._user_id}")
+        self.user_id_file.write_text(user_id, encoding="utf-8")
+        print(f"[UserManager] Generated new user ID: {user_id}")
+        return user_id
+
+    def get_user_id(self) -> str:
+        """Return the user ID loaded at construction."""
         return self._user_id
 
 
@@ -0,0 +1,56 @@
+"""
+Check that /api/activity/batch rejects bad request bodies with 422.
+
+parse_activity_batch decodes the body itself, so its validation errors
+must stay JSON-encodable: a malformed or empty body is a client error,
+never a 500.
+
+Run from the repository root:  python scripts/test_activity_batch_body.py
+"""
+
+import os
+import sys
+import tempfile
+
+# Point the app at a throwaway database before any app module is imported
+_DB_PATH = os.path.join(tempfile.mkdtemp(), "batch_body_test.db")
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{_DB_PATH}"
+
+# Adjust the path so we can import app modules directly
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'backend')))
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.activity import router
+
+# name: (body, content type, expected status)
+BAD_BODIES = {
+    "malformed JSON": (b'{"events": [', "application/json", 422),
+    "empty JSON": (b"", "application/json", 422),
+    "wrong shape": (b'{"events": "nope"}', "application/json", 422),
+    "malformed msgpack": (b"\xc1", "application/msgpack", 400),
+}
+
+
+def test_bad_bodies_are_client_errors() -> None:
+    app = FastAPI()
+    app.include_router(router, prefix="/api/activity")
+    client = TestClient(app, raise_server_exceptions=False)
+
+    for name, (body, content_type, expected) in BAD_BODIES.items():
+        response = client.post(
+            "/api/activity/batch", content=body, headers={"Content-Type": content_type}
+        )
+        assert response.status_code == expected, f"{name}: {response.status_code} {response.text}"
+        if expected == 422:
+            assert response.json()["detail"][0]["loc"][0] == "body", response.text
+
+
+def main():
+    test_bad_bodies_are_client_errors()
+    print("OK: bad /batch bodies are rejected as client errors")
+
+
+if __name__ == "__main__":
+    main()
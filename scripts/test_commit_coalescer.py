@@ -0,0 +1,181 @@
+"""
+Check the commit coalescer's transactions against the rest of the app.
+
+When a shared transaction fails, CommitCoalescer rolls it back and re-runs
+every job on its own. Job 1 below succeeds and job 2 raises; afterwards
+job 1's event and classification must each exist exactly once, including
+when job 1 is replayed again after it committed.
+
+A request session that reads, lets a coalescer commit land, and then
+writes must still commit (no "database is locked").
+
+Run from the repository root:  python scripts/test_commit_coalescer.py
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+import uuid
+from datetime import datetime
+
+# Point the app at a throwaway database before any app module is imported
+_DB_PATH = os.path.join(tempfile.mkdtemp(), "coalescer_test.db")
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{_DB_PATH}"
+
+# Adjust the path so we can import app modules directly
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'backend')))
+
+from sqlalchemy import func, select
+
+from app.api.activity import _make_write_job
+from app.core.commit_coalescer import CommitCoalescer
+from app.core.database import async_session_maker, close_db, init_db
+from app.models.activity import ActivityEvent, BrowserSession, Classification
+
+
+def _event_values(event_id: str) -> dict:
+    now = datetime.utcnow()
+    return {
+        "event_id": event_id,
+        "user_id": None,
+        "session_id": None,
+        "source": "browser",
+        "activity_type": "webpage",
+        "timestamp": now,
+        "start_time": now,
+        "end_time": None,
+        "url": "https://github.com/x",
+        "domain": "github.com",
+        "path": "/x",
+        "title": "Repo",
+        "app_name": None,
+        "app_path": None,
+        "window_title": None,
+        "active_time": 0,
+        "idle_time": 0,
+        "tab_id": 0,
+        "window_id": 0,
+        "is_incognito": False,
+        "url_components": None,
+        "title_hints": None,
+        "engagement": None,
+        "context_data": None,
+        "classification_id": None,
+    }
+
+
+async def _failing_job(session) -> None:
+    raise RuntimeError("job 2 failed")
+
+
+async def _counts(event_ids) -> tuple:
+    async with async_session_maker() as session:
+        events = await session.scalar(
+            select(func.count()).select_from(ActivityEvent).where(ActivityEvent.event_id.in_(event_ids))
+        )
+        classifications = await session.scalar(
+            select(func.count()).select_from(Classification)
+        )
+    return events, classifications
+
+
+def _observed(job, event_id: str, seen: list):
+    """Wrap job to record whether its event already exists each time it runs."""
+    async def run(session):
+        seen.append(await session.scalar(
+            select(func.count()).select_from(ActivityEvent).where(ActivityEvent.event_id == event_id)
+        ))
+        return await job(session)
+    return run
+
+
+async def _run_shared_window(coalescer: CommitCoalescer, job, event_id: str) -> None:
+    """Submit job and the failing job in the same coalescing window.
+
+    The shared transaction fails, so job runs twice (shared, then alone);
+    its event must not have been committed by the first run.
+    """
+    seen: list = []
+    results = await asyncio.gather(
+        coalescer.submit(_observed(job, event_id, seen)),
+        coalescer.submit(_failing_job),
+        return_exceptions=True,
+    )
+    assert not isinstance(results[0], Exception), results[0]
+    assert isinstance(results[1], RuntimeError), results[1]
+    assert seen == [0, 0], f"rows leaked out of the rolled-back transaction: {seen}"
+
+
+async def test_replay_does_not_duplicate_rows() -> None:
+    await init_db()
+    coalescer = CommitCoalescer()
+    coalescer.start()
+    try:
+        # Job 1 with a classification: classifications insert after the events
+        classified_id = str(uuid.uuid4())
+        classified_job = _make_write_job(
+            [_event_values(classified_id)],
+            {classified_id: {"category": "productivity", "confidence": 0.9, "source": "rules"}},
+        )
+        await _run_shared_window(coalescer, classified_job, classified_id)
+        assert await _counts([classified_id]) == (1, 1)
+
+        # Job 1 without a classification: its first statement is a SAVEPOINT,
+        # which must not commit on its own when the shared transaction fails
+        plain_id = str(uuid.uuid4())
+        plain_job = _make_write_job([_event_values(plain_id)], {})
+        await _run_shared_window(coalescer, plain_job, plain_id)
+        assert await _counts([plain_id]) == (1, 1)
+
+        # Replaying an already committed job stores nothing twice
+        stored_ids, failed = await coalescer.submit(classified_job)
+        assert stored_ids == set() and failed == []
+        assert await _counts([classified_id, plain_id]) == (2, 1)
+    finally:
+        await coalescer.stop()
+        await close_db()
+
+
+async def test_read_then_write_after_coalescer_commit() -> None:
+    await init_db()
+    coalescer = CommitCoalescer()
+    coalescer.start()
+    try:
+        session_id = str(uuid.uuid4())
+        async with async_session_maker() as session:
+            session.add(BrowserSession(session_id=session_id, status="active"))
+            await session.commit()
+
+        # Same shape as update_session: read, (other commit), write
+        async with async_session_maker() as session:
+            browser_session = await session.scalar(
+                select(BrowserSession).where(BrowserSession.session_id == session_id)
+            )
+
+            event_id = str(uuid.uuid4())
+            await coalescer.submit(_make_write_job([_event_values(event_id)], {}))
+
+            browser_session.status = "ended"
+            await session.commit()
+
+        async with async_session_maker() as session:
+            status = await session.scalar(
+                select(BrowserSession.status).where(BrowserSession.session_id == session_id)
+            )
+        assert status == "ended", status
+        assert (await _counts([event_id]))[0] == 1
+    finally:
+        await coalescer.stop()
+        await close_db()
+
+
+def main():
+    asyncio.run(test_replay_does_not_duplicate_rows())
+    print("OK: coalescer replay stored each row once")
+    asyncio.run(test_read_then_write_after_coalescer_commit())
+    print("OK: request session wrote after a coalescer commit")
+
+
+if __name__ == "__main__":
+    main()
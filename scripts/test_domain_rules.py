@@ -0,0 +1,63 @@
+"""
+Pin how the productivity / non-academic domain rules treat host variants.
+
+Dotted patterns match on whole domain labels: subdomains and regional
+hosts (a pattern followed by a country-code label, e.g. amazon.com.au)
+keep the pattern's rule; hosts that merely contain the pattern text
+inside another label (xbox.com, github.community) do not.
+
+Run from the repository root:  python scripts/test_domain_rules.py
+"""
+
+import os
+import sys
+
+# Adjust the path so we can import app modules directly
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'backend')))
+
+from app.components.classification.component import ClassificationComponent
+
+# domain: expected category
+EXPECTED = {
+    # Exact and subdomain matches
+    "github.com": "productivity",
+    "gist.github.com": "productivity",
+    "www.reddit.com": "non_academic",
+    # Regional hosts: pattern followed by a country-code label
+    "amazon.com.au": "non_academic",
+    "www.amazon.com.au": "non_academic",
+    "ebay.com.au": "non_academic",
+    "linkedin.com.au": "non_academic",
+    "github.com.au": "productivity",
+    "reddit.com.br": "non_academic",
+    # Pattern text inside another label is not a match
+    "xbox.com": "neutral",
+    "box.com": "neutral",
+    "notgithub.com": "neutral",
+    "github.community": "neutral",
+    # Nor is a pattern followed by an unrelated registrable domain
+    "reddit.com.example.net": "neutral",
+}
+
+
+def _category(domain: str) -> str:
+    category, _, _ = ClassificationComponent._classify_by_rules(domain, f"https://{domain}/", "")
+    return category
+
+
+def test_domain_variants() -> None:
+    mismatches = {
+        domain: (expected, _category(domain))
+        for domain, expected in EXPECTED.items()
+        if _category(domain) != expected
+    }
+    assert not mismatches, f"(expected, got) per domain: {mismatches}"
+
+
+def main():
+    test_domain_variants()
+    print(f"OK: {len(EXPECTED)} domain variants classified as intended")
+
+
+if __name__ == "__main__":
+    main()